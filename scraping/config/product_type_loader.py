@@ -1,8 +1,33 @@
+import functools
 import json
 import sys
 from pathlib import Path
 from typing import Dict, Any, Optional
 from core.logger import uploader_logger
+from core.file_manager import loads_json
+
+
+@functools.lru_cache(maxsize=8)
+def _read_json_bytes(path: str, mtime_ns: int) -> bytes:
+    """Read a JSON file's bytes; cached per (path, mtime) so edits are picked up."""
+    return Path(path).read_bytes()
+
+
+# Bundled config next to this module; resolved once at import
+PRODUCT_TYPES_PATH = Path(__file__).parent / "product_types.json"
+
+
+def load_json_cached(path) -> Any:
+    """Return a fresh copy of a JSON file's contents, reading it only once
+    until the file changes on disk.
+
+    The copy comes from re-parsing the cached bytes with loads_json (orjson,
+    a project dependency), which is several times cheaper than deep-copying
+    a parsed tree.
+    """
+    path = Path(path)
+    return loads_json(_read_json_bytes(str(path), path.stat().st_mtime_ns))
+
 
 class ConfigLoader:
     """Load configuration from JSON files with logging."""
@@ -15,7 +40,7 @@ class ConfigLoader:
         """
         # Try multiple possible locations
         possible_paths = [
-            Path(__file__).parent / "product_types.json",  # Same directory as this file
+            PRODUCT_TYPES_PATH,  # Same directory as this file
             Path.cwd() / "config" / "product_types.json",  # config folder in root
             Path.cwd() / "product_types.json",  # Root directory
         ]
@@ -23,8 +48,7 @@ class ConfigLoader:
         for config_path in possible_paths:
             if config_path.exists():
                 try:
-                    with open(config_path, 'r', encoding='utf-8') as f:
-                        config_data = json.load(f)
+                    config_data = load_json_cached(config_path)
                     uploader_logger.info(f"✅ Loaded product type mapping from: {config_path}")
                     return config_data
                 except json.JSONDecodeError as e:
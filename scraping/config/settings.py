@@ -11,11 +11,12 @@ DATA_DIR = BASE_DIR / "data"
 RAW_DATA_DIR = DATA_DIR / "raw"
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
 ARCHIVE_DIR = DATA_DIR / "archive"
+FAILED_DATA_DIR = DATA_DIR / "failed"
 LOG_DIR = BASE_DIR / "logs"
 CACHE_DIR = BASE_DIR / ".cache"
 
 # Create directories
-for directory in [DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, ARCHIVE_DIR, LOG_DIR, CACHE_DIR]:
+for directory in [DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, ARCHIVE_DIR, FAILED_DATA_DIR, LOG_DIR, CACHE_DIR]:
     directory.mkdir(exist_ok=True, parents=True)
 
 # File paths
@@ -68,4 +69,6 @@ DEFAULT_HEADERS = {
 
 # Logging
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-LOG_LEVEL = "INFO"
\ No newline at end of file
+LOG_LEVEL = "INFO"
+LOG_MAX_BYTES = 64 * 1024 * 1024  # Rotate rarely; rollover runs on the log listener thread
+LOG_BACKUP_COUNT = 5
\ No newline at end of file
@@ -2,7 +2,9 @@
 Cache management for shop verification and data.
 """
 
+import atexit
 import json
+import threading
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 import config.settings as settings
@@ -14,6 +16,11 @@ class CacheManager:
     def __init__(self, cache_file: str = "shop_cache.json"):
         self.cache_file = settings.CACHE_DIR / cache_file
         self.cache = self._load_cache()
+        
+        # Entries set during a run are written once, not on every update
+        self._lock = threading.Lock()
+        self._dirty = {"shops": set(), "verification": set()}
+        atexit.register(self.flush)
     
     def _load_cache(self) -> Dict[str, Any]:
         """Load cache from file."""
@@ -30,11 +37,36 @@ class CacheManager:
     def _save_cache(self):
         """Save cache to file."""
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                with open(self.cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.cache, f, indent=2, ensure_ascii=False)
+                self._dirty = {"shops": set(), "verification": set()}
         except Exception as e:
             scraper_logger.error(f"Failed to save cache: {e}")
     
+    def flush(self):
+        """Write entries updated since the last save.
+        
+        Other CacheManager instances share the same file, so only this
+        instance's updated entries are merged into what is on disk.
+        """
+        with self._lock:
+            if not any(self._dirty.values()):
+                return
+            
+            on_disk = self._load_cache()
+            for section, keys in self._dirty.items():
+                target = on_disk.setdefault(section, {})
+                for key in keys:
+                    target[key] = self.cache[section][key]
+            
+            try:
+                with open(self.cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(on_disk, f, indent=2, ensure_ascii=False)
+                self._dirty = {"shops": set(), "verification": set()}
+            except Exception as e:
+                scraper_logger.error(f"Failed to save cache: {e}")
+    
     def get_shop_verification(self, base_url: str) -> Optional[bool]:
         """Get cached shop verification result."""
         if base_url in self.cache.get("verification", {}):
@@ -49,12 +81,14 @@ class CacheManager:
         if "verification" not in self.cache:
             self.cache["verification"] = {}
         
+        now = datetime.now()
         self.cache["verification"][base_url] = {
             "is_shopify": is_shopify,
-            "expiry": (datetime.now() + timedelta(days=expiry_days)).isoformat(),
-            "checked": datetime.now().isoformat()
+            "expiry": (now + timedelta(days=expiry_days)).isoformat(),
+            "checked": now.isoformat()
         }
-        self._save_cache()
+        with self._lock:
+            self._dirty["verification"].add(base_url)
     
     def get_shop_data(self, shop_id: str) -> Optional[Dict[str, Any]]:
         """Get cached shop data."""
@@ -65,12 +99,14 @@ class CacheManager:
         if "shops" not in self.cache:
             self.cache["shops"] = {}
         
+        now = datetime.now()
         self.cache["shops"][shop_id] = {
             "data": data,
-            "expiry": (datetime.now() + timedelta(hours=expiry_hours)).isoformat(),
-            "cached": datetime.now().isoformat()
+            "expiry": (now + timedelta(hours=expiry_hours)).isoformat(),
+            "cached": now.isoformat()
         }
-        self._save_cache()
+        with self._lock:
+            self._dirty["shops"].add(shop_id)
     
     def clear_expired(self):
         """Clear expired cache entries."""
@@ -3,6 +3,7 @@ File management for scraped data.
 """
 
 import json
+import os
 import shutil
 from pathlib import Path
 from datetime import datetime
@@ -10,6 +11,62 @@ from typing import List, Dict, Any, Optional
 import config.settings as settings
 from core.logger import scraper_logger, uploader_logger
 
+# orjson is a declared dependency; the JSON helpers below are the one place
+# that uses it, and stdlib json keeps bare installs working
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dump_json(path, obj) -> None:
+    """Write obj to path as indented JSON, using orjson when available.
+
+    The stdlib fallback uses json.dump, which streams encoded chunks to
+    the file instead of building the whole string first.
+    """
+    if orjson is not None:
+        Path(path).write_bytes(
+            orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+
+# Directories already created this process; repeat mkdir calls are skipped
+_ensured_dirs = set()
+
+def ensure_dir(path) -> None:
+    """Create directory path (and parents) once per process."""
+    key = str(path)
+    if key not in _ensured_dirs:
+        Path(path).mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(key)
+
+def loads_json(data) -> Any:
+    """Parse JSON from bytes or str, using orjson when available.
+
+    Decode errors from either parser are ValueErrors.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def load_json(path) -> Any:
+    """Read and parse the JSON file at path, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _sorted_json_names(dir_path: Path) -> List[str]:
+    """Return sorted names of the .json files directly inside dir_path.
+
+    Uses os.scandir so only names are read; callers build Path objects
+    for the entries they actually touch.
+    """
+    with os.scandir(dir_path) as it:
+        return sorted(e.name for e in it if e.name.endswith('.json') and e.is_file())
+
 class FileManager:
     """Manages file operations for scraped data."""
     
@@ -17,7 +74,8 @@ class FileManager:
         self.data_dirs = {
             'raw': settings.RAW_DATA_DIR,
             'processed': settings.PROCESSED_DATA_DIR,
-            'archive': settings.ARCHIVE_DIR
+            'archive': settings.ARCHIVE_DIR,
+            'failed': settings.FAILED_DATA_DIR,
         }
         
         # Create subdirectories for each entity type under raw and processed.
@@ -35,14 +93,15 @@ class FileManager:
             # <shop>_<entity>_<timestamp>.json where the second token
             # exactly equals the entity_type. This avoids substring
             # collisions.
-            for p in sorted(processed_root.glob("*.json")):
-                parts = p.name.split("_")
+            for name in _sorted_json_names(processed_root):
+                parts = name.split("_")
                 if len(parts) < 3:
                     continue
                 token = parts[1]
                 if token in entity_types:
+                    p = processed_root / name
                     try:
-                        target = self.data_dirs['processed'] / token / p.name
+                        target = self.data_dirs['processed'] / token / name
                         if not target.exists():
                             shutil.move(str(p), str(target))
                             uploader_logger.info(f"Reorganized processed file {p.name} -> processed/{token}/")
@@ -62,8 +121,7 @@ class FileManager:
         filepath = self.data_dirs['raw'] / data_type / filename
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            dump_json(filepath, data)
             
             scraper_logger.info(f"Saved {len(data)} {data_type} to {filepath}")
             return filepath
@@ -116,7 +174,7 @@ class FileManager:
             else:
                 target_dir = self.data_dirs['processed']
 
-            target_dir.mkdir(parents=True, exist_ok=True)
+            ensure_dir(target_dir)
             processed_path = target_dir / filepath.name
             shutil.move(str(filepath), str(processed_path))
 
@@ -171,13 +229,14 @@ class FileManager:
             # second underscore-separated token exactly matches
             # the requested data_type. This avoids accidental
             # matches.
-            for p in sorted(src_dir.glob("*.json")):
-                parts = p.name.split("_")
+            for name in _sorted_json_names(src_dir):
+                parts = name.split("_")
                 if len(parts) < 3:
                     continue
                 if parts[1] != data_type:
                     continue
-                target = raw_dir / p.name
+                p = src_dir / name
+                target = raw_dir / name
                 if target.exists():
                     uploader_logger.info(f"Skipping move; target already exists: {target}")
                     continue
@@ -220,8 +279,7 @@ class FileManager:
             if not path.exists():
                 return None
             
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_json(path)
                 
         except Exception as e:
             scraper_logger.error(f"Failed to read JSON from {filepath}: {e}")
@@ -231,10 +289,9 @@ class FileManager:
         """Write data to a JSON file."""
         try:
             path = Path(filepath)
-            path.parent.mkdir(parents=True, exist_ok=True)
+            ensure_dir(path.parent)
             
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            dump_json(path, data)
             
             scraper_logger.info(f"Wrote JSON to {filepath}")
             return True
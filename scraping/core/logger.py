@@ -2,34 +2,117 @@
 Centralized logging configuration.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional
 import config.settings as settings
+
+# One background listener per logger; stopped at exit so queued records flush
+_listeners: Dict[str, QueueListener] = {}
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that doesn't flush after every record.
+    
+    Records below WARNING stay in the file buffer until the listener flushes
+    on idle. Rollover uses a running size count, because the stock check
+    seeks the stream and that flushes it.
+    """
+    
+    def _open(self):
+        stream = super()._open()
+        self._size = stream.tell()
+        return stream
+    
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            # maxBytes and tell() are in bytes; emoji take several each
+            size = len(msg.encode(self.encoding or 'utf-8', errors='replace'))
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._size and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushOnIdleQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs dry.
+    
+    Bursts of records are written in buffered chunks; nothing stays
+    unflushed once logging goes quiet.
+    """
+    
+    def dequeue(self, block):
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return super().dequeue(block)
+
 def setup_logger(name: str, log_file: Optional[str] = None) -> logging.Logger:
-    """Setup logger with console and optional file output."""
+    """Setup logger with console and optional file output.
+    
+    The logger itself only enqueues records; a QueueListener thread does the
+    actual console and file writes so logging calls don't block on I/O.
+    """
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, settings.LOG_LEVEL))
     
     # Clear existing handlers
     logger.handlers.clear()
+    if name in _listeners:
+        _listeners.pop(name).stop()
+    
+    handlers = []
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_format = logging.Formatter(settings.LOG_FORMAT)
     console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File handler if specified
     if log_file:
         log_path = settings.LOG_DIR / log_file
-        file_handler = logging.FileHandler(log_path, encoding='utf-8')
+        file_handler = BufferedRotatingFileHandler(
+            log_path,
+            maxBytes=settings.LOG_MAX_BYTES,
+            backupCount=settings.LOG_BACKUP_COUNT,
+            encoding='utf-8',
+            delay=True,
+        )
         file_format = logging.Formatter(settings.LOG_FORMAT)
         file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    
+    listener = _FlushOnIdleQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
     
     return logger
 
+@atexit.register
+def _stop_listeners() -> None:
+    """Drain and stop all log listeners."""
+    for listener in _listeners.values():
+        listener.stop()
+    _listeners.clear()
+
 # Create main loggers
 scraper_logger = setup_logger("scraper", "scraper.log")
 uploader_logger = setup_logger("uploader", "uploader.log")
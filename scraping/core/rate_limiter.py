@@ -2,6 +2,7 @@
 Intelligent rate limiter with adaptive delays and robust 429 handling.
 """
 
+import threading
 import time
 import random
 from collections import defaultdict
@@ -17,7 +18,12 @@ class SmartRateLimiter:
         self.shop_delays = defaultdict(lambda: base_delay)
         self.shop_errors = defaultdict(int)
         self.shop_429_count = defaultdict(int)
-        self.last_request_time = defaultdict(float)
+        # time.monotonic() of each shop's last request; wall-clock jumps
+        # must not stretch or skip the spacing
+        self.last_request_time = {}
+        # Scrapers share one limiter across threads; slots are reserved
+        # under this lock so concurrent requests to a shop queue up
+        self._lock = threading.Lock()
         
     def get_delay(self, shop_id: str) -> float:
         """Get current delay for a specific shop."""
@@ -85,45 +91,48 @@ class SmartRateLimiter:
         # Default retry time for 429 without Retry-After header
         return 5.0
     
+    def _time_since_last(self, shop_id: str) -> float:
+        """Seconds since the last request to a shop (infinite if none yet)."""
+        last = self.last_request_time.get(shop_id)
+        if last is None:
+            return float('inf')
+        return time.monotonic() - last
+    
+    def _reserve_slot(self, shop_id: str, delay: float, min_wait: float = 0.0) -> float:
+        """Claim the next request slot for a shop and sleep until it arrives.
+        
+        The slot is recorded before sleeping, so another thread asking for
+        the same shop waits behind it instead of going at the same time.
+        """
+        with self._lock:
+            time_since_last = self._time_since_last(shop_id)
+            wait_time = max(delay - time_since_last, min_wait)
+            self.last_request_time[shop_id] = time.monotonic() + wait_time
+        
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+    
     def wait(self, shop_id: str, response=None, error: bool = False) -> float:
         """Adapt delay and wait appropriate amount of time."""
         # Calculate wait time based on response
-        wait_time = self.adapt_delay(shop_id, response, error)
-        
-        # Ensure minimum time between requests to same shop
-        time_since_last = time.time() - self.last_request_time.get(shop_id, 0)
-        if time_since_last < wait_time:
-            actual_wait = wait_time - time_since_last
-        else:
-            actual_wait = 0.1  # Tiny wait even if enough time passed
-        
-        if actual_wait > 0:
-            time.sleep(actual_wait)
+        with self._lock:
+            wait_time = self.adapt_delay(shop_id, response, error)
         
-        self.last_request_time[shop_id] = time.time()
-        return actual_wait
+        # Ensure minimum time between requests to same shop, plus a tiny
+        # wait even if enough time passed
+        return self._reserve_slot(shop_id, wait_time, min_wait=0.1)
     
     def wait_before_request(self, shop_id: str) -> float:
         """Wait before making a request (proactive rate limiting)."""
-        current_delay = self.shop_delays[shop_id]
-        time_since_last = time.time() - self.last_request_time.get(shop_id, 0)
-        
-        if time_since_last < current_delay:
-            wait_time = current_delay - time_since_last
-            time.sleep(wait_time)
-            self.last_request_time[shop_id] = time.time()
-            return wait_time
-        
-        self.last_request_time[shop_id] = time.time()
-        return 0
+        return self._reserve_slot(shop_id, self.shop_delays[shop_id])
     
     def reset_shop(self, shop_id: str):
         """Reset delay and error count for a shop."""
         self.shop_delays[shop_id] = self.base_delay
         self.shop_errors[shop_id] = 0
         self.shop_429_count[shop_id] = 0
-        if shop_id in self.last_request_time:
-            del self.last_request_time[shop_id]
+        self.last_request_time.pop(shop_id, None)
     
     def get_stats(self, shop_id: str) -> dict:
         """Get current stats for a shop."""
@@ -131,5 +140,5 @@ class SmartRateLimiter:
             'current_delay': self.shop_delays[shop_id],
             'error_count': self.shop_errors[shop_id],
             'consecutive_429s': self.shop_429_count[shop_id],
-            'last_request': self.last_request_time.get(shop_id, 0)
+            'seconds_since_last_request': self._time_since_last(shop_id)
         }
\ No newline at end of file
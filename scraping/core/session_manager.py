@@ -6,6 +6,7 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import random
+import threading
 import config.settings as settings
 
 USER_AGENTS = [
@@ -18,45 +19,57 @@ class SessionManager:
     """Manages HTTP sessions with retry logic."""
     
     _sessions = {}
+    _lock = threading.Lock()
     
     @classmethod
     def get_session(cls, shop_id: str = "default") -> requests.Session:
         """Get or create a session for a specific shop."""
-        if shop_id not in cls._sessions:
-            session = requests.Session()
-            
-            # Configure retry strategy
-            retry_strategy = Retry(
-                total=settings.SCRAPER_CONFIG['retry_attempts'],
-                backoff_factor=1,
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=["GET", "POST"],
-                raise_on_status=False,
-            )
-            
-            adapter = HTTPAdapter(
-                max_retries=retry_strategy,
-                pool_connections=10,
-                pool_maxsize=20
-            )
-            
-            session.mount("http://", adapter)
-            session.mount("https://", adapter)
-            
-            # Set headers
-            headers = settings.DEFAULT_HEADERS.copy()
-            headers["User-Agent"] = random.choice(USER_AGENTS)
-            # Avoid advertising brotli to servers if the runtime may not support it
-            ae = headers.get('Accept-Encoding', '')
-            if 'br' in ae:
-                parts = [p.strip() for p in ae.split(',') if p.strip() and p.strip() != 'br']
-                headers['Accept-Encoding'] = ', '.join(parts) if parts else 'gzip, deflate'
+        session = cls._sessions.get(shop_id)
+        if session is not None:
+            return session
+        
+        # Shop and product scrapers run concurrently; make sure they end up
+        # sharing one session (and its keep-alive pool) per shop
+        with cls._lock:
+            if shop_id not in cls._sessions:
+                cls._sessions[shop_id] = cls._create_session()
+            return cls._sessions[shop_id]
+    
+    @classmethod
+    def _create_session(cls) -> requests.Session:
+        """Create a session with retries, connection pooling and headers."""
+        session = requests.Session()
+        
+        # Configure retry strategy
+        retry_strategy = Retry(
+            total=settings.SCRAPER_CONFIG['retry_attempts'],
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "POST"],
+            raise_on_status=False,
+        )
+        
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=10,
+            pool_maxsize=20
+        )
+        
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        
+        # Set headers
+        headers = settings.DEFAULT_HEADERS.copy()
+        headers["User-Agent"] = random.choice(USER_AGENTS)
+        # Avoid advertising brotli to servers if the runtime may not support it
+        ae = headers.get('Accept-Encoding', '')
+        if 'br' in ae:
+            parts = [p.strip() for p in ae.split(',') if p.strip() and p.strip() != 'br']
+            headers['Accept-Encoding'] = ', '.join(parts) if parts else 'gzip, deflate'
 
-            session.headers.update(headers)
-            
-            cls._sessions[shop_id] = session
+        session.headers.update(headers)
         
-        return cls._sessions[shop_id]
+        return session
     
     @classmethod
     def get_headers(cls) -> dict:
@@ -68,6 +81,8 @@ class SessionManager:
     @classmethod
     def close_all(cls):
         """Close all sessions."""
-        for session in cls._sessions.values():
-            session.close()
-        cls._sessions.clear()
\ No newline at end of file
+        with cls._lock:
+            sessions = list(cls._sessions.values())
+            cls._sessions.clear()
+        for session in sessions:
+            session.close()
\ No newline at end of file
@@ -5,6 +5,7 @@ State manager for tracking scraped data across runs.
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
@@ -13,6 +14,12 @@ import hashlib
 from core.file_manager import FileManager
 from core.cache_manager import CacheManager
 
+# State files are bookkeeping; write them on one background thread (which
+# keeps writes in order and lets each write merge into the file on disk)
+# so scraper threads don't wait on disk. Pending writes are completed at
+# interpreter exit.
+_state_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state_writer")
+
 
 class StateManager:
     """Manages scraper state across runs using files and cache."""
@@ -94,19 +101,30 @@ class StateManager:
             
             state[data_type]['item_versions'] = item_versions
         
-        # Save to file
+        # Update memory cache right away so reads see the new state
+        state['_timestamp'] = time.time()
+        self.memory_cache[f"shop_state_{shop_id}"] = state
+        
+        # Only this data type's entry goes to the writer; it is copied
+        # because later updates mutate it while the write is queued
         state_file = self.data_dir / f"{shop_id}_state.json"
+        _state_writer.submit(
+            self._write_state_file, state_file, data_type, dict(state[data_type])
+        )
+    
+    def _write_state_file(self, state_file: Path, data_type: str,
+                          type_state: Dict[str, Any]):
+        """Merge one data type's state into a shop's state file.
+        
+        Runs on the state writer thread, so the read-merge-write can't
+        interleave with another write and entries for other data types
+        (possibly from another StateManager) are kept.
+        """
         try:
-            # Remove cache timestamp before saving
-            if '_timestamp' in state:
-                del state['_timestamp']
-            
+            state = self.file_manager.read_json(str(state_file)) or {}
+            state.pop('_timestamp', None)
+            state[data_type] = type_state
             self.file_manager.write_json(str(state_file), state)
-            
-            # Update memory cache
-            state['_timestamp'] = time.time()
-            self.memory_cache[f"shop_state_{shop_id}"] = state
-            
         except Exception as e:
             print(f"Warning: Could not save shop state: {e}")
     
@@ -121,7 +139,7 @@ class StateManager:
             return False  # Never scraped before
         
         try:
-            last_time = datetime.fromisoformat(last_scraped.replace('Z', '+00:00'))
+            last_time = datetime.fromisoformat(last_scraped)
             hours_since = (datetime.now() - last_time).total_seconds() / 3600
             
             # Skip if scraped recently
@@ -172,9 +190,7 @@ class StateManager:
                         timestamp_str = info.get('timestamp')
                         if timestamp_str:
                             try:
-                                item_time = datetime.fromisoformat(
-                                    timestamp_str.replace('Z', '+00:00')
-                                ).timestamp()
+                                item_time = datetime.fromisoformat(timestamp_str).timestamp()
                                 if item_time > cutoff_time:
                                     filtered[handle] = info
                             except:
@@ -2,7 +2,7 @@
 Main orchestrator for the entire system with scrapers.
 """
 
-import json
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 import time
@@ -22,6 +22,12 @@ from core.logger import scraper_logger, uploader_logger
 import config.settings as settings
 from uploader.db_client import DatabaseClient
 from core.state_manager import StateManager
+from core.rate_limiter import SmartRateLimiter
+from core.file_manager import dump_json
+from config.product_type_loader import load_json_cached
+
+# Background pool for result file writes so disk I/O overlaps scraping
+_io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="save_results")
 
 
 class PipelineOrchestrator:
@@ -36,9 +42,14 @@ class PipelineOrchestrator:
         # Initialize state manager
         self.state_manager = StateManager()
         
-        # Initialize scrapers
-        self.shop_scraper = ShopScraper()
-        self.product_scraper = ProductScraper()
+        # Initialize scrapers. The shop and product stages run side by side
+        # on the same shops, so they share state and per-shop rate limits.
+        rate_limiter = SmartRateLimiter(
+            base_delay=settings.SCRAPER_CONFIG['base_delay'],
+            max_delay=settings.SCRAPER_CONFIG['max_delay']
+        )
+        self.shop_scraper = ShopScraper(self.state_manager, rate_limiter)
+        self.product_scraper = ProductScraper(self.state_manager, rate_limiter)
         
         # Initialize uploaders
         self.shop_uploader = ShopUploader()
@@ -56,6 +67,9 @@ class PipelineOrchestrator:
         
         # Full scrape flag
         self.full_product_scrape = False
+        
+        # Pending background result writes
+        self._pending_saves = []
     
     def set_full_product_scrape(self, enabled: bool = True):
         """Enable or disable full product scraping mode."""
@@ -70,11 +84,33 @@ class PipelineOrchestrator:
             if hasattr(self.product_scraper, 'set_full_scrape_mode'):
                 self.product_scraper.set_full_scrape_mode(False)
     
+    def save_results_async(self, scraper, results: Dict[str, List[Dict[str, Any]]],
+                           timestamp: Optional[str] = None) -> int:
+        """Queue scraper results to be written to disk on the I/O pool.
+        
+        Returns the total number of records queued, so callers don't need
+        a second pass over the results to count them.
+        """
+        timestamp = timestamp or self.timestamp
+        total_records = 0
+        for shop_id, data in results.items():
+            if data:
+                total_records += len(data)
+                self._pending_saves.append(
+                    _io_pool.submit(scraper.save_results, shop_id, data, timestamp)
+                )
+        return total_records
+    
+    def wait_for_saves(self):
+        """Block until all queued result writes have finished."""
+        if self._pending_saves:
+            wait(self._pending_saves)
+            self._pending_saves = []
+    
     def load_shops(self) -> List[Dict[str, Any]]:
         """Load shops from configuration."""
         try:
-            with open(settings.SHOP_URLS_FILE, 'r', encoding='utf-8') as f:
-                shops = json.load(f)
+            shops = load_json_cached(settings.SHOP_URLS_FILE)
             
             if not isinstance(shops, list):
                 self.logger.error("Shop URLs file must contain a list")
@@ -138,7 +174,7 @@ class PipelineOrchestrator:
             # Check if we should skip this shop for this data type
             if self.state_manager.should_skip_data_type(shop_id, data_type, hours_threshold):
                 self.total_shops_skipped += 1
-                self.logger.debug(f"Skipping {data_type} for {shop_id} - scraped recently")
+                self.logger.debug("Skipping %s for %s - scraped recently", data_type, shop_id)
             else:
                 shops_needed.append(shop)
         
@@ -177,7 +213,7 @@ class PipelineOrchestrator:
         
         try:
             # Use the scraper's own scrape_multiple method
-            results = scraper.scrape_multiple(shops_to_scrape)
+            results = scraper.scrape_multiple(shops_to_scrape, max_workers=self.max_concurrent_shops)
         finally:
             # Restore original settings
             if scraper_name.lower() == 'products' and self.full_product_scrape and original_skip_hours is not None:
@@ -243,51 +279,67 @@ class PipelineOrchestrator:
         all_shop_results = {}
         all_product_results = {}
         all_mapping_results = {}
+        total_shop_records = 0
+        total_product_records = 0
         
         total_batches = (len(shops) - 1) // self.batch_size + 1
         
-        for batch_num, batch_start in enumerate(range(0, len(shops), self.batch_size), 1):
-            batch = shops[batch_start:batch_start + self.batch_size]
-            
-            self.logger.info(f"\nProcessing batch {batch_num}/{total_batches} ({len(batch)} shops)")
-            batch_start_time = time.time()
-            
-            # Step 1: Scrape shops (if not skipped) - shops are always scraped
-            if not skip_shops:
-                self.logger.info("Scraping shop information...")
-                shop_results = self.shop_scraper.scrape_multiple(batch)
-                all_shop_results.update(shop_results)
-                
-                for shop_id, data in shop_results.items():
-                    if data:
-                        self.shop_scraper.save_results(shop_id, data, self.timestamp)
-            
-            # Step 2: Scrape products
-            self.logger.info("Scraping products...")
-            
-            # Use force_scrape for full product scrape mode
-            force_scrape = self.full_product_scrape
-            
-            product_results = self._scrape_with_optimization(
-                self.product_scraper, batch, "Products", 
-                hours_threshold=6,  # 6 hours
-                force_scrape=force_scrape
-            )
-            all_product_results.update(product_results)
-            
-            for shop_id, data in product_results.items():
-                if data:
-                    self.product_scraper.save_results(shop_id, data, self.timestamp)
-            
-            # Log batch completion
-            batch_time = time.time() - batch_start_time
-            self.logger.info(f"Batch {batch_num} completed in {batch_time/60:.1f} minutes")
+        # Shop and product scraping are independent, so the shop stage runs
+        # on a background thread while products are scraped on this one.
+        with ThreadPoolExecutor(max_workers=1) as stage_executor:
+            try:
+                for batch_num, batch_start in enumerate(range(0, len(shops), self.batch_size), 1):
+                    batch = shops[batch_start:batch_start + self.batch_size]
+                    
+                    self.logger.info(f"\nProcessing batch {batch_num}/{total_batches} ({len(batch)} shops)")
+                    batch_start_time = time.time()
+                    
+                    # Step 1: Scrape shops (if not skipped) - shops are always scraped
+                    shop_future = None
+                    if not skip_shops:
+                        self.logger.info("Scraping shop information...")
+                        shop_future = stage_executor.submit(
+                            self.shop_scraper.scrape_multiple, batch,
+                            max_workers=self.max_concurrent_shops
+                        )
+                    
+                    # Step 2: Scrape products
+                    self.logger.info("Scraping products...")
+                    
+                    # Use force_scrape for full product scrape mode
+                    force_scrape = self.full_product_scrape
+                    
+                    product_results = self._scrape_with_optimization(
+                        self.product_scraper, batch, "Products", 
+                        hours_threshold=6,  # 6 hours
+                        force_scrape=force_scrape
+                    )
+                    all_product_results.update(product_results)
+                    total_product_records += self.save_results_async(self.product_scraper, product_results)
+                    
+                    # Wait for the shop stage of this batch before moving on
+                    if shop_future is not None:
+                        shop_results = shop_future.result()
+                        all_shop_results.update(shop_results)
+                        total_shop_records += self.save_results_async(self.shop_scraper, shop_results)
+                    
+                    # Log batch completion
+                    batch_time = time.time() - batch_start_time
+                    self.logger.info(f"Batch {batch_num} completed in {batch_time/60:.1f} minutes")
+            except BaseException:
+                # Interrupted: drop the queued shop stage instead of letting
+                # the executor wait for it on the way out
+                stage_executor.shutdown(wait=False, cancel_futures=True)
+                raise
+        
+        # Make sure every raw file is on disk before anything reads it back
+        self.wait_for_saves()
         
         # Update results with optimization statistics
         if not skip_shops:
             self.results['scraping']['steps']['shops'] = {
                 'shops_scraped': len(all_shop_results),
-                'total_records': sum(len(data) for data in all_shop_results.values()),
+                'total_records': total_shop_records,
                 'optimization': 'none (always scrape shops)'
             }
         
@@ -299,7 +351,7 @@ class PipelineOrchestrator:
         
         self.results['scraping']['steps']['products'] = {
             'shops_scraped': len(all_product_results),
-            'total_records': sum(len(data) for data in all_product_results.values()),
+            'total_records': total_product_records,
             'shops_skipped': len(shops) - len(all_product_results),
             'optimization': product_optimization
         }
@@ -326,8 +378,12 @@ class PipelineOrchestrator:
         
         return self.results['scraping']
     
-    def run_upload_pipeline(self) -> Dict[str, Any]:
-        """Run the complete upload pipeline without RPC refresh."""
+    def run_upload_pipeline(self, shop_upload: Optional[Future] = None) -> Dict[str, Any]:
+        """Run the complete upload pipeline without RPC refresh.
+        
+        If shop_upload is given, it is an already-running shop upload whose
+        result is awaited instead of uploading shops again.
+        """
         uploader_logger.info("\n" + "="*60)
         uploader_logger.info("STARTING UPLOAD PIPELINE")
         uploader_logger.info("="*60)
@@ -337,24 +393,21 @@ class PipelineOrchestrator:
             'steps': {}
         }
         
-        # Step 1: Upload shops
-        uploader_logger.info("\nStep 1: Uploading shops...")
-        shop_upload_results = self.shop_uploader.process_all()
+        # Step 1: Upload shops (products reference them, so this finishes first)
+        if shop_upload is None:
+            uploader_logger.info("\nStep 1: Uploading shops...")
+            shop_upload_results = self.shop_uploader.process_all()
+        else:
+            uploader_logger.info("\nStep 1: Waiting for shop upload...")
+            shop_upload_results = shop_upload.result()
         self.results['uploading']['steps']['shops'] = shop_upload_results
         
         # Step 2: Upload products (with related data)
         uploader_logger.info("\nStep 3: Uploading products...")
         product_upload_results = self.product_uploader.process_all()
         self.results['uploading']['steps']['products'] = product_upload_results
-        
-        # **CRITICAL: Wait for product upload to complete and commit**
-        if product_upload_results.get('total_products', 0) > 0:
-            wait_time = 5  # Increased from 3 to 5 seconds for better reliability
-            uploader_logger.info(
-                f"Waiting {wait_time} seconds for {product_upload_results['total_products']} "
-                f"products to commit to database..."
-            )
-            time.sleep(wait_time)
+        # Pool connections are autocommit, so every upsert above is already
+        # committed by the time process_all returns
         
         uploader_logger.info("\n" + "="*60)
         uploader_logger.info("UPLOAD PIPELINE COMPLETE")
@@ -373,16 +426,27 @@ class PipelineOrchestrator:
             self.logger.info("🔄 FULL PRODUCT SCRAPE MODE")
         self.logger.info("="*60)
         
-        # Scraping phase
-        scraping_results = self.run_scraping_pipeline(
-            shops=shops,
-            skip_shops=skip_shops,
-            shop_update_days=shop_update_days,
-            full_product_scrape=full_product_scrape
-        )
-        
-        # Uploading phase
-        upload_results = self.run_upload_pipeline()
+        # The shop upload reads the shop config, not scraped data, so it runs
+        # alongside scraping; only the product upload has to wait for both
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="shop_upload") as upload_executor:
+            shop_upload = upload_executor.submit(self.shop_uploader.process_all)
+            
+            try:
+                # Scraping phase
+                scraping_results = self.run_scraping_pipeline(
+                    shops=shops,
+                    skip_shops=skip_shops,
+                    shop_update_days=shop_update_days,
+                    full_product_scrape=full_product_scrape
+                )
+                
+                # Uploading phase
+                upload_results = self.run_upload_pipeline(shop_upload=shop_upload)
+            except BaseException:
+                # Interrupted: cancel the shop upload if it hasn't started
+                # instead of letting the executor wait for it on the way out
+                upload_executor.shutdown(wait=False, cancel_futures=True)
+                raise
         
         # Generate summary with optimization info
         self._generate_summary()
@@ -418,8 +482,7 @@ class PipelineOrchestrator:
         
         # Save summary to file
         summary_file = settings.DATA_DIR / f"pipeline_summary_{self.timestamp}.json"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        dump_json(summary_file, summary)
         
         self.logger.info(f"Summary saved to: {summary_file}")
 
@@ -5,7 +5,6 @@ Main runner script for the Shopify scraper system.
 
 import os
 import sys
-import json
 import argparse
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -16,6 +15,11 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from orchestrator.main import PipelineOrchestrator
 import config.settings as settings
 from uploader.db_client import DatabaseClient
+from core.file_manager import dump_json
+from core.session_manager import SessionManager
+
+# Set from --verbose; prints per-shop detail instead of summary lines
+VERBOSE = False
 
 def setup_environment():
     """Setup environment and logging."""
@@ -46,8 +50,7 @@ def setup_database_structure(args):
             print("Database structure setup complete")
             # Save result file
             out = settings.DATA_DIR / f"setup_database_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(out, 'w', encoding='utf-8') as fh:
-                json.dump({'status': 'success', 'data': result}, fh, indent=2, ensure_ascii=False)
+            dump_json(out, {'status': 'success', 'data': result})
             print(f"Setup result saved to: {out}")
             return True
         else:
@@ -68,8 +71,12 @@ def filter_shops_needing_update(shops, days_threshold=7):
     Returns:
         List of shops that need updating
     """
+    if days_threshold is None or days_threshold <= 0:
+        return list(shops)
+    
     cutoff = datetime.now() - timedelta(days=days_threshold)
     shops_to_update = []
+    skipped = []
     
     for shop in shops:
         # Check various possible timestamp fields
@@ -82,17 +89,21 @@ def filter_shops_needing_update(shops, days_threshold=7):
             shops_to_update.append(shop)
         else:
             try:
-                # Handle ISO format timestamps
-                last_dt = datetime.fromisoformat(last_scraped.replace('Z', '+00:00'))
+                # ISO timestamps; fromisoformat accepts a trailing 'Z' on 3.11+
+                last_dt = datetime.fromisoformat(last_scraped)
                 if last_dt < cutoff:
                     shops_to_update.append(shop)
                 else:
-                    shop_id = shop.get('id') or shop.get('url', 'unknown')
-                    print(f"  Skipping shop {shop_id} (last scraped: {last_scraped})")
-            except (ValueError, AttributeError):
+                    skipped.append((shop.get('id') or shop.get('url', 'unknown'), last_scraped))
+            except (ValueError, TypeError):
                 # Invalid timestamp, include for scraping
                 shops_to_update.append(shop)
     
+    if skipped:
+        if VERBOSE:
+            print("\n".join(f"  Skipping shop {sid} (last scraped: {ts})" for sid, ts in skipped))
+        print(f"  Skipping {len(skipped)} recently-scraped shops")
+    
     return shops_to_update
 
 def filter_shops_by_id(shops, shop_id_filter):
@@ -100,19 +111,16 @@ def filter_shops_by_id(shops, shop_id_filter):
     if not shop_id_filter:
         return shops
     
-    raw_vals = [v.strip() for v in shop_id_filter.split(',') if v.strip()]
+    # Precompute the wanted ids/urls once so each shop is a set lookup
+    wanted = {v.strip() for v in shop_id_filter.split(',') if v.strip()}
     filtered = []
     
     for s in shops:
         sid = str(s.get('id') or s.get('shop_id', '')).strip()
         url = (s.get('url') or '').strip()
         
-        for v in raw_vals:
-            if not v:
-                continue
-            if v == sid or v == url:
-                filtered.append(s)
-                break
+        if sid in wanted or url in wanted:
+            filtered.append(s)
     
     return filtered
 
@@ -162,32 +170,32 @@ def run_scraping_only(args):
     # Handle individual scraper modes
     results = {
         'total_shops': len(shops),
-        'timestamp': datetime.now().strftime('%Y%m%d_%H%M%S'),
+        'timestamp': orchestrator.timestamp,
         'steps': {}
     }
     
     # Shops scraper
     if getattr(args, 'scrape_shops', False) or (not any(flags) and not skip_shops):
         shop_update_days = getattr(args, 'shop_update_days', None)
+        shops_to_scrape = filter_shops_needing_update(shops, days_threshold=shop_update_days)
         
-        if shop_update_days is not None and shop_update_days > 0:
-            print(f"\nFiltering shops: only scraping those older than {shop_update_days} days...")
-            shops_to_scrape = filter_shops_needing_update(shops, days_threshold=shop_update_days)
-            print(f"Found {len(shops_to_scrape)} shops needing update (out of {len(shops)} total)")
-        else:
-            shops_to_scrape = shops
+        if len(shops_to_scrape) < len(shops):
+            print(f"\nOnly scraping shops older than {shop_update_days} days: "
+                  f"{len(shops_to_scrape)} need update (out of {len(shops)} total)")
         
         if shops_to_scrape:
             print(f"\nStep: Scraping {len(shops_to_scrape)} shops...")
-            shop_results = orchestrator.shop_scraper.scrape_multiple(shops_to_scrape)
+            shop_results = orchestrator.shop_scraper.scrape_multiple(
+                shops_to_scrape, max_workers=orchestrator.max_concurrent_shops
+            )
+            total_records = orchestrator.save_results_async(
+                orchestrator.shop_scraper, shop_results, results['timestamp']
+            )
             results['steps']['shops'] = {
                 'shops_scraped': len(shop_results),
                 'shops_skipped': len(shops) - len(shops_to_scrape),
-                'total_records': sum(len(data) for data in shop_results.values())
+                'total_records': total_records
             }
-            for shop_id, data in shop_results.items():
-                if data:
-                    orchestrator.shop_scraper.save_results(shop_id, data, results['timestamp'])
         else:
             print("\nStep: All shops recently updated, skipping shop scraping")
             results['steps']['shops'] = {
@@ -199,15 +207,18 @@ def run_scraping_only(args):
     # Products scraper
     if getattr(args, 'scrape_products', False):
         print("\nStep: Scraping products...")
-        product_results = orchestrator.product_scraper.scrape_multiple(shops)
+        product_results = orchestrator.product_scraper.scrape_multiple(
+            shops, max_workers=orchestrator.max_concurrent_shops
+        )
+        total_records = orchestrator.save_results_async(
+            orchestrator.product_scraper, product_results, results['timestamp']
+        )
         results['steps']['products'] = {
             'shops_scraped': len(product_results),
-            'total_records': sum(len(data) for data in product_results.values())
+            'total_records': total_records
         }
-        for shop_id, data in product_results.items():
-            if data:
-                orchestrator.product_scraper.save_results(shop_id, data, results['timestamp'])
     
+    orchestrator.wait_for_saves()
     print("\nScraping finished")
     return results
 
@@ -228,7 +239,7 @@ def run_upload_only(args):
     
     # Handle individual upload modes
     results = {
-        'timestamp': datetime.now().strftime('%Y%m%d_%H%M%S'),
+        'timestamp': orchestrator.timestamp,
         'steps': {}
     }
     
@@ -357,9 +368,14 @@ def main():
     parser.add_argument("--output-dir", type=str,
                        default=str(settings.DATA_DIR),
                        help="Output directory for data")
+    parser.add_argument("--verbose", action="store_true",
+                       help="Print per-shop detail (e.g. each skipped shop)")
     
     args = parser.parse_args()
     
+    global VERBOSE
+    VERBOSE = args.verbose
+    
     # Update settings if specified
     if args.shops_file:
         settings.SHOP_URLS_FILE = Path(args.shops_file)
@@ -369,6 +385,7 @@ def main():
         settings.RAW_DATA_DIR = settings.DATA_DIR / "raw"
         settings.PROCESSED_DATA_DIR = settings.DATA_DIR / "processed"
         settings.ARCHIVE_DIR = settings.DATA_DIR / "archive"
+        settings.FAILED_DATA_DIR = settings.DATA_DIR / "failed"
     
     # Setup environment
     setup_environment()
@@ -400,12 +417,10 @@ def main():
         else:  # all
             results = run_complete_pipeline(args)
         
-        # Save results
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Save results under the run's timestamp so filenames line up
+        timestamp = (results or {}).get('timestamp') or datetime.now().strftime('%Y%m%d_%H%M%S')
         results_file = settings.DATA_DIR / f"run_results_{timestamp}.json"
-        
-        with open(results_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        dump_json(results_file, results)
         
         print(f"\nResults saved to: {results_file}")
         print(f"\n{'='*60}")
@@ -429,6 +444,8 @@ def main():
             DatabaseClient.cleanup()
         except Exception as e:
             print(f"Error closing database pool: {e}")
+        # Release pooled keep-alive connections to the shops
+        SessionManager.close_all()
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -12,7 +12,7 @@ import config.settings as settings
 from core.rate_limiter import SmartRateLimiter
 from core.session_manager import SessionManager
 from core.cache_manager import CacheManager
-from core.file_manager import FileManager
+from core.file_manager import FileManager, loads_json
 from core.logger import scraper_logger
 from json import JSONDecodeError
 import gzip
@@ -21,9 +21,11 @@ import zlib
 class BaseScraper(ABC):
     """Abstract base class for all Shopify scrapers."""
     
-    def __init__(self, scraper_type: str):
+    def __init__(self, scraper_type: str, rate_limiter: Optional[SmartRateLimiter] = None):
         self.scraper_type = scraper_type
-        self.rate_limiter = SmartRateLimiter(
+        # Scrapers that hit the same shops at once should share a limiter so
+        # per-shop spacing covers all of their requests
+        self.rate_limiter = rate_limiter or SmartRateLimiter(
             base_delay=settings.SCRAPER_CONFIG['base_delay'],
             max_delay=settings.SCRAPER_CONFIG['max_delay']
         )
@@ -50,17 +52,23 @@ class BaseScraper(ABC):
                 for shop in shops
             }
             
-            for future in as_completed(future_to_shop):
-                shop = future_to_shop[future]
-                shop_id = shop.get('id', 'unknown')
-                
-                try:
-                    shop_results = future.result()
-                    results[shop_id] = shop_results
-                    self.logger.info(f"Scraped {len(shop_results)} {self.scraper_type} for {shop_id}")
-                except Exception as e:
-                    self.logger.error(f"Failed to scrape {self.scraper_type} for {shop_id}: {e}")
-                    results[shop_id] = []
+            try:
+                for future in as_completed(future_to_shop):
+                    shop = future_to_shop[future]
+                    shop_id = shop.get('id', 'unknown')
+                    
+                    try:
+                        shop_results = future.result()
+                        results[shop_id] = shop_results
+                        self.logger.info(f"Scraped {len(shop_results)} {self.scraper_type} for {shop_id}")
+                    except Exception as e:
+                        self.logger.error(f"Failed to scrape {self.scraper_type} for {shop_id}: {e}")
+                        results[shop_id] = []
+            except BaseException:
+                # Interrupted: drop queued shops instead of scraping them all
+                # before the executor lets us exit
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
         
         return results
     
@@ -166,10 +174,16 @@ class BaseScraper(ABC):
     def _safe_parse_json(self, response) -> Any:
         """Safely parse JSON from a requests Response.
 
-        Tries response.json() first, and falls back to handling compressed
-        content (brotli/gzip/zlib) or decoding bytes if necessary.
+        Tries the raw body (parsed with orjson via loads_json) and
+        response.json(), and falls back to handling compressed content (brotli/gzip/zlib) or
+        decoding bytes if necessary.
         Returns parsed JSON object, or None if parsing failed.
         """
+        # Parses the UTF-8 bytes directly, skipping the str decode
+        try:
+            return loads_json(response.content)
+        except ValueError:
+            pass
         try:
             return response.json()
         except (ValueError, JSONDecodeError):
@@ -5,20 +5,31 @@ Now with robust 429 error handling and retry logic.
 """
 
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import time
-import json
+import random
+from pathlib import Path
+import requests
 from scrapers.base_scraper import BaseScraper
 from config.schemas import ProductData
+from core.rate_limiter import SmartRateLimiter
 from core.session_manager import SessionManager
 from core.state_manager import StateManager
+from config.product_type_loader import load_json_cached
+
+# Resolved once at import instead of on every filter reload
+PRODUCT_FILTERS_PATH = Path(__file__).resolve().parent.parent / "config" / "product_filters.json"
 
 
 class ProductScraper(BaseScraper):
     """Product scraper - supports both incremental and full scraping."""
 
-    def __init__(self):
-        super().__init__("products")
+    def __init__(
+        self,
+        state_manager: Optional[StateManager] = None,
+        rate_limiter: Optional[SmartRateLimiter] = None,
+    ):
+        super().__init__("products", rate_limiter)
 
         # TWO MODES: Full vs Incremental
         self.full_scrape_mode = False  # Set to True for initial data collection
@@ -41,7 +52,7 @@ class ProductScraper(BaseScraper):
         self.max_requests_per_shop = self.inc_max_requests
 
         # State tracking
-        self.state_manager = StateManager()
+        self.state_manager = state_manager or StateManager()
 
         # Rate limiting
         self.min_shop_delay = 30  # Seconds between shops
@@ -65,57 +76,66 @@ class ProductScraper(BaseScraper):
 
         # Load product filters
         self.filters = self._load_filters()
+        self._filter_rules = self._compile_filters(self.filters)
 
     def _load_filters(self) -> Dict[str, List[Dict]]:
         """Load product filters from config file."""
         try:
-            import os
-
-            config_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)),
-                "config",
-                "product_filters.json",
-            )
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    return json.load(f)
+            if PRODUCT_FILTERS_PATH.exists():
+                return load_json_cached(PRODUCT_FILTERS_PATH)
             return {}
         except Exception as e:
             self.logger.error(f"Error loading product filters: {e}")
             return {}
 
+    @staticmethod
+    def _compile_filters(filters: Dict[str, List[Dict]]) -> Optional[Dict[str, Any]]:
+        """Precompute filter lookups once per load instead of per product.
+
+        Vendor filters become a set of (vendor, product_type) pairs; pattern
+        filters are split into lowercased case-insensitive patterns and
+        case-sensitive ones.
+        """
+        if not filters:
+            return None
+
+        def split_patterns(rules: List[Dict]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+            insensitive = tuple(
+                f.get("pattern", "").lower() for f in rules if f.get("case_insensitive", False)
+            )
+            sensitive = tuple(
+                f.get("pattern", "") for f in rules if not f.get("case_insensitive", False)
+            )
+            return insensitive, sensitive
+
+        return {
+            "vendor_pairs": frozenset(
+                (f.get("vendor"), f.get("product_type"))
+                for f in filters.get("vendor_filters", [])
+            ),
+            "title": split_patterns(filters.get("title_filters", [])),
+            "product_type": split_patterns(filters.get("product_type_filters", [])),
+        }
+
     def _should_skip_product(self, product: Dict[str, Any], vendor: str) -> bool:
         """Check if product should be filtered out based on criteria."""
-        if not self.filters:
+        rules = self._filter_rules
+        if not rules:
             return False
 
         # Vendor filters
-        for f in self.filters.get("vendor_filters", []):
-            if f.get("vendor") == vendor and f.get("product_type") == product.get(
-                "product_type"
-            ):
+        if (vendor, product.get("product_type")) in rules["vendor_pairs"]:
+            return True
+
+        # Title and Product Type filters
+        for field in ("title", "product_type"):
+            insensitive, sensitive = rules[field]
+            value = product.get(field, "")
+            if any(pattern in value for pattern in sensitive):
                 return True
-
-        # Title filters
-        title = product.get("title", "")
-        for f in self.filters.get("title_filters", []):
-            pattern = f.get("pattern", "")
-            if f.get("case_insensitive", False):
-                if pattern.lower() in title.lower():
-                    return True
-            else:
-                if pattern in title:
-                    return True
-
-        # Product Type filters
-        p_type = product.get("product_type", "")
-        for f in self.filters.get("product_type_filters", []):
-            pattern = f.get("pattern", "")
-            if f.get("case_insensitive", False):
-                if pattern.lower() in p_type.lower():
-                    return True
-            else:
-                if pattern in p_type:
+            if insensitive:
+                lowered = value.lower()
+                if any(pattern in lowered for pattern in insensitive):
                     return True
 
         return False
@@ -172,13 +192,24 @@ class ProductScraper(BaseScraper):
                 data = self._safe_parse_json(response)
                 return data
 
-            except Exception as e:
+            except (
+                requests.ConnectionError,
+                requests.Timeout,
+                requests.exceptions.ChunkedEncodingError,
+            ) as e:
                 self.logger.error(f"Error fetching page {page}: {e}")
                 if retry_count < self.max_429_retries:
                     retry_count += 1
-                    time.sleep(2 * retry_count)  # Linear backoff for errors
+                    # Capped exponential backoff with jitter so shops that
+                    # failed together don't all retry in lockstep
+                    backoff = min(2 ** retry_count, self.rate_limiter.max_delay)
+                    time.sleep(random.uniform(backoff / 2, backoff))
                 else:
                     return None
+            except Exception as e:
+                # Not a transient network error; retrying won't help
+                self.logger.error(f"Error fetching page {page}: {e}")
+                return None
 
         return None
 
@@ -252,7 +283,8 @@ class ProductScraper(BaseScraper):
                 # Reset empty counter
                 empty_pages = 0
 
-                # Process each product
+                # Process each product; one timestamp covers the whole page
+                scraped_at = datetime.now().isoformat()
                 for product in products:
                     try:
                         # Check global filters
@@ -268,7 +300,7 @@ class ProductScraper(BaseScraper):
                                 continue
 
                         product_data = self._convert_to_product_data(
-                            product, shop_id, base_url
+                            product, shop_id, base_url, scraped_at
                         )
                         if product_data:
                             all_products.append(product_data.to_dict())
@@ -401,7 +433,8 @@ class ProductScraper(BaseScraper):
 
                 empty_pages = 0
 
-                # Process products with OOS filtering
+                # Process products with OOS filtering; one timestamp per page
+                scraped_at = datetime.now().isoformat()
                 for product in products:
                     try:
                         # Check global filters first
@@ -417,7 +450,7 @@ class ProductScraper(BaseScraper):
                                 continue
 
                         product_data = self._convert_to_product_data(
-                            product, shop_id, base_url
+                            product, shop_id, base_url, scraped_at
                         )
                         if product_data:
                             all_products.append(product_data.to_dict())
@@ -467,7 +500,11 @@ class ProductScraper(BaseScraper):
             return []
 
     def _convert_to_product_data(
-        self, product: Dict[str, Any], shop_id: str, base_url: str
+        self,
+        product: Dict[str, Any],
+        shop_id: str,
+        base_url: str,
+        scraped_at: Optional[str] = None,
     ) -> Optional[ProductData]:
         """Convert raw Shopify product to ProductData."""
         try:
@@ -476,7 +513,7 @@ class ProductScraper(BaseScraper):
 
             return ProductData(
                 shop_id=shop_id,
-                scraped_at=datetime.now().isoformat(),
+                scraped_at=scraped_at or datetime.now().isoformat(),
                 id=str(product.get("id", "")),
                 handle=handle,
                 title=product.get("title", ""),
@@ -3,22 +3,26 @@ Scraper for shop information with state tracking.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 import time
-from bs4 import BeautifulSoup
 
 from scrapers.base_scraper import BaseScraper
 from config.schemas import ShopData
+from core.rate_limiter import SmartRateLimiter
 from core.session_manager import SessionManager
 from core.state_manager import StateManager
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 
 class ShopScraper(BaseScraper):
     """Scraper for shop information with intelligent updates."""
     
-    def __init__(self):
-        super().__init__('shops')
-        self.state_manager = StateManager()
+    def __init__(self, state_manager: Optional[StateManager] = None,
+                 rate_limiter: Optional[SmartRateLimiter] = None):
+        super().__init__('shops', rate_limiter)
+        self.state_manager = state_manager or StateManager()
         
         # Shop update settings
         self.shop_update_days = 7  # Update shop info weekly
@@ -104,7 +108,7 @@ class ShopScraper(BaseScraper):
                 continue  # Never scraped before
             
             try:
-                last_time = datetime.fromisoformat(last_scraped.replace('Z', '+00:00'))
+                last_time = datetime.fromisoformat(last_scraped)
                 days_since = (datetime.now() - last_time).days
                 
                 # Skip if scraped within update threshold
@@ -161,6 +165,10 @@ class ShopScraper(BaseScraper):
             self.rate_limiter.wait(shop_id, response)
             
             if response.status_code == 200:
+                # bs4 is only needed for this rare fallback; import it lazily
+                # to keep it off the startup path
+                from bs4 import BeautifulSoup
+                
                 soup = BeautifulSoup(response.text, 'html.parser')
                 
                 # Extract shop name from title
@@ -194,7 +202,7 @@ class ShopScraper(BaseScraper):
 
         return shop_info
     
-    def _check_shopify_in_html(self, soup: BeautifulSoup) -> bool:
+    def _check_shopify_in_html(self, soup: "BeautifulSoup") -> bool:
         """Check if HTML contains Shopify indicators."""
         html_text = str(soup).lower()
         
@@ -258,10 +266,11 @@ class ShopScraper(BaseScraper):
     def _update_shop_state(self, shop_id: str, success: bool, 
                            shop_info: Optional[Dict] = None):
         """Update shop state after scraping."""
+        now = datetime.now().isoformat()
         state_data = {
-            'last_scraped': datetime.now().isoformat(),
+            'last_scraped': now,
             'success': success,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now,
         }
         
         if shop_info:
@@ -350,7 +359,7 @@ class ShopScraper(BaseScraper):
                 continue
             
             try:
-                last_time = datetime.fromisoformat(last_scraped.replace('Z', '+00:00'))
+                last_time = datetime.fromisoformat(last_scraped)
                 if last_time < cutoff_time:
                     # Mark shop as potentially inactive
                     self.logger.debug(f"Shop {shop_id} last seen {last_time}, marking as inactive")
@@ -1,10 +1,9 @@
-import json
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
 from uploader.db_client import DatabaseClient
-from core.file_manager import FileManager
+from core.file_manager import FileManager, dump_json, ensure_dir, load_json
 from core.logger import uploader_logger
 
 class BaseUploader(ABC):
@@ -59,8 +58,7 @@ class BaseUploader(ABC):
         self.logger.info(f"Processing {filepath.name}")
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                raw_data = json.load(f)
+            raw_data = load_json(filepath)
             # Transform data
             transformed_data = self.transform_data(raw_data)
 
@@ -124,18 +122,16 @@ class BaseUploader(ABC):
                 try:
                     processed_root = self.file_manager.data_dirs['processed']
                     target_dir = processed_root / (self.entity_type or self.get_table_name())
-                    target_dir.mkdir(parents=True, exist_ok=True)
+                    ensure_dir(target_dir)
                     processed_path = target_dir / filepath.name
-                    with open(processed_path, 'w', encoding='utf-8') as pf:
-                        json.dump(transformed_data, pf, indent=2, ensure_ascii=False)
+                    dump_json(processed_path, transformed_data)
                 except Exception as e:
                     self.logger.error(f"Failed to write processed file for {filepath.name}: {e}")
 
                 # If there are unprocessed records, overwrite the raw file so they remain for retry
                 try:
                     if unprocessed:
-                        with open(filepath, 'w', encoding='utf-8') as rf:
-                            json.dump(unprocessed, rf, indent=2, ensure_ascii=False)
+                        dump_json(filepath, unprocessed)
                         self.logger.info(f"Left {len(unprocessed)} unprocessed records in {filepath.name} for retry")
                     else:
                         # All records processed; remove original raw file
@@ -10,6 +10,68 @@ from urllib.parse import urlparse, parse_qsl, urlencode
 
 from core.logger import uploader_logger
 
+# Size lookups for extract_size, built once instead of per variant
+_SIZE_MAPPING = {
+    "X-SMALL": "XS",
+    "XSMALL": "XS",
+    "XX-SMALL": "XXS",
+    "SMALL": "S",
+    "MEDIUM": "M",
+    "LARGE": "L",
+    "X-LARGE": "XL",
+    "XLARGE": "XL",
+    "XX-LARGE": "2XL",
+    "XXLARGE": "2XL",
+    "XXX-LARGE": "3XL",
+    "XXXLARGE": "3XL",
+    "XXXX-LARGE": "4XL",
+    "XXXXLARGE": "4XL",
+    "XXL": "2XL",
+    "XXXL": "3XL",
+    "XXXXL": "4XL",
+    "1X": "XL",
+    "2X": "2XL",
+    "3X": "3XL",
+    "4X": "4XL",
+    "ONE SIZE": "ONE SIZE",
+    "OS": "ONE SIZE",
+    "O/S": "ONE SIZE",
+    "ALL": "ONE SIZE",
+}
+
+# Ordered for the fallback scan; the frozenset is for membership checks
+_VALID_SIZE_ORDER = (
+    "XXS",
+    "XS",
+    "S",
+    "M",
+    "L",
+    "XL",
+    "2XL",
+    "3XL",
+    "4XL",
+    "ONE SIZE",
+)
+_VALID_SIZES = frozenset(_VALID_SIZE_ORDER)
+
+# Compiled extract_size patterns. The fallback scans keep the order of the
+# tables above; word boundaries stop '3XL' from matching 'XL'.
+_SIZE_SPLIT_RE = re.compile(r"[/|\-,]")
+_SIZE_PREFIX_RE = re.compile(r"^(US|UK|EU|SIZE)\s+")
+_NUMERIC_SIZE_RE = re.compile(r"^0?\d{1,2}$")
+_WAIST_SIZE_RE = re.compile(r"^\d{1,2}W$")
+_NUMERIC_FALLBACK_RE = re.compile(r"\b(US|UK|EU|SIZE)?\s*(\d{1,2}W?)\b")
+_SIZE_WORD_PATTERNS = tuple(
+    (re.compile(r"\b" + re.escape(word) + r"\b"), mapped)
+    for word, mapped in _SIZE_MAPPING.items()
+)
+_VALID_SIZE_PATTERNS = tuple(
+    (re.compile(r"\b" + re.escape(valid) + r"\b"), valid) for valid in _VALID_SIZE_ORDER
+)
+
+# Values clean_boolean treats as true (1 also matches True and 1.0)
+_TRUTHY_VALUES = frozenset({1, "1", "true", "yes"})
+
 
 class DataProcessor:
     """Processes data for database upload."""
@@ -35,7 +97,10 @@ class DataProcessor:
     @staticmethod
     def clean_boolean(value: Any) -> bool:
         """Converts various truthy values to boolean."""
-        return value in [1, "1", True, "true", "yes"]
+        try:
+            return value in _TRUTHY_VALUES
+        except TypeError:  # unhashable, e.g. a list
+            return False
 
     @staticmethod
     def generate_deterministic_id(namespace_string: str, *components) -> str:
@@ -98,77 +163,36 @@ class DataProcessor:
         title_upper = title.upper()
 
         # Split by common separators (/, -, |, ,)
-        parts = [p.strip() for p in re.split(r"[/|\-,]", title_upper)]
-
-        size_mapping = {
-            "X-SMALL": "XS",
-            "XSMALL": "XS",
-            "XX-SMALL": "XXS",
-            "SMALL": "S",
-            "MEDIUM": "M",
-            "LARGE": "L",
-            "X-LARGE": "XL",
-            "XLARGE": "XL",
-            "XX-LARGE": "2XL",
-            "XXLARGE": "2XL",
-            "XXX-LARGE": "3XL",
-            "XXXLARGE": "3XL",
-            "XXXX-LARGE": "4XL",
-            "XXXXLARGE": "4XL",
-            "XXL": "2XL",
-            "XXXL": "3XL",
-            "XXXXL": "4XL",
-            "1X": "XL",
-            "2X": "2XL",
-            "3X": "3XL",
-            "4X": "4XL",
-            "ONE SIZE": "ONE SIZE",
-            "OS": "ONE SIZE",
-            "O/S": "ONE SIZE",
-            "ALL": "ONE SIZE",
-        }
-
-        valid_sizes = {
-            "XXS",
-            "XS",
-            "S",
-            "M",
-            "L",
-            "XL",
-            "2XL",
-            "3XL",
-            "4XL",
-            "ONE SIZE",
-        }
+        parts = [p.strip() for p in _SIZE_SPLIT_RE.split(title_upper)]
 
         for part in parts:
-            if part in size_mapping:
-                return size_mapping[part]
-            if part in valid_sizes:
+            if part in _SIZE_MAPPING:
+                return _SIZE_MAPPING[part]
+            if part in _VALID_SIZES:
                 return part
 
             # Numeric checks: "8", "08", "24W", "US 8", "UK 10"
-            clean_part = re.sub(r"^(US|UK|EU|SIZE)\s+", "", part).strip()
+            clean_part = _SIZE_PREFIX_RE.sub("", part).strip()
 
-            if re.match(r"^0?\d{1,2}$", clean_part):
+            if _NUMERIC_SIZE_RE.match(clean_part):
                 if clean_part == "0" or clean_part == "00":
                     return clean_part
                 return str(int(clean_part))
 
-            if re.match(r"^\d{1,2}W$", clean_part):
+            if _WAIST_SIZE_RE.match(clean_part):
                 return clean_part
 
         # Regex fallback using word boundaries to ensure '3XL' doesn't match 'XL'
-        for word, mapped in size_mapping.items():
-            if re.search(r"\b" + re.escape(word) + r"\b", title_upper):
+        for pattern, mapped in _SIZE_WORD_PATTERNS:
+            if pattern.search(title_upper):
                 return mapped
 
-        for valid in valid_sizes:
-            if re.search(r"\b" + re.escape(valid) + r"\b", title_upper):
+        for pattern, valid in _VALID_SIZE_PATTERNS:
+            if pattern.search(title_upper):
                 return valid
 
         # Regex for numeric fallback correctly capturing isolated numbers
-        num_match = re.search(r"\b(US|UK|EU|SIZE)?\s*(\d{1,2}W?)\b", title_upper)
+        num_match = _NUMERIC_FALLBACK_RE.search(title_upper)
         if num_match:
             val = num_match.group(2)
             if val.endswith("W"):
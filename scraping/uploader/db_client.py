@@ -10,12 +10,14 @@ from psycopg import Connection
 from psycopg.rows import dict_row
 from psycopg_pool import ConnectionPool
 
-from dotenv import load_dotenv
 from core.logger import uploader_logger
 import config.settings as settings
 
-# Load .env file once at module import (only if it exists)
-if settings.ENV_FILE.exists():
+# Load .env file once at module import (only if it exists and the
+# connection string isn't already in the environment, as it is in CI)
+if not (os.environ.get("VITE_DATABASE_URL") or os.environ.get("DATABASE_URL")) \
+        and settings.ENV_FILE.exists():
+    from dotenv import load_dotenv
     load_dotenv(settings.ENV_FILE)
 
 
@@ -27,8 +29,11 @@ class DatabaseClient:
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialize()
+            # Only cache a fully initialized client, so a missing connection
+            # string fails every construction instead of just the first
+            instance = super().__new__(cls)
+            instance._initialize()
+            cls._instance = instance
         return cls._instance
 
     def _initialize(self):
@@ -169,6 +174,13 @@ class DatabaseClient:
 
         total_batches = (len(data) + batch_size - 1) // batch_size
 
+        # Conflict keys are the same for every batch, so parse them once
+        conflict_keys = (
+            [k.strip() for k in str(on_conflict).split(",") if k.strip()]
+            if on_conflict
+            else []
+        )
+
         for i in range(0, len(data), batch_size):
             batch = data[i : i + batch_size]
             batch_num = (i // batch_size) + 1
@@ -177,11 +189,10 @@ class DatabaseClient:
             deduped_batch = batch
             if on_conflict:
                 try:
-                    keys = [k.strip() for k in str(on_conflict).split(",") if k.strip()]
                     seen = {}
                     for rec in batch:
                         # Create a key based on the conflict columns
-                        key_val = tuple(rec.get(k) for k in keys)
+                        key_val = tuple(rec.get(k) for k in conflict_keys)
                         seen[key_val] = rec
 
                     if len(seen) != len(batch):
@@ -210,9 +221,6 @@ class DatabaseClient:
             sql = f'INSERT INTO "{table_name}" ({cols_str}) VALUES ({vals_str})'
 
             if on_conflict:
-                conflict_keys = [
-                    k.strip() for k in str(on_conflict).split(",") if k.strip()
-                ]
                 conflict_clause = ", ".join(f'"{k}"' for k in conflict_keys)
 
                 # UPDATE SET col = EXCLUDED.col
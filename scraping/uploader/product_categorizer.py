@@ -1,4 +1,5 @@
 from typing import Dict, Optional, Tuple, List, Any, Union
+from collections import defaultdict
 import re
 from config.product_type_loader import ConfigLoader
 from core.logger import uploader_logger
@@ -28,13 +29,13 @@ class ProductCategorizer:
             patterns = []
             for keyword in rules.get("keywords", []):
                 # Escape special characters and create word boundary pattern
-                pattern = r"\b" + re.escape(keyword) + r"\b"
+                pattern = re.compile(r"\b" + re.escape(keyword) + r"\b")
                 patterns.append(pattern)
 
             # Create exclude patterns
             exclude_patterns = []
             for exclude in rules.get("exclude", []):
-                pattern = r"\b" + re.escape(exclude) + r"\b"
+                pattern = re.compile(r"\b" + re.escape(exclude) + r"\b")
                 exclude_patterns.append(pattern)
 
             self._keyword_patterns[category] = {
@@ -44,6 +45,18 @@ class ProductCategorizer:
                 "raw_excludes": rules.get("exclude", []),
             }
 
+        # Word-boundary patterns for gender detection, paired with the raw
+        # term for the substring fallback
+        self._gender_patterns = {
+            category: [
+                (pattern, re.compile(r"\b" + re.escape(pattern) + r"\b"))
+                for pattern in pattern_list
+            ]
+            for category, pattern_list in self.config.get(
+                "gender_age_patterns", {}
+            ).items()
+        }
+
     def _normalize_text(self, text: str) -> str:
         """Normalize text for matching."""
         if not text or not isinstance(text, str):
@@ -51,23 +64,25 @@ class ProductCategorizer:
         return text.lower().strip()
 
     def _calculate_match_score(
-        self, text: str, patterns: List[str], keywords: List[str]
+        self, text: str, patterns: List[re.Pattern], keywords: List[str]
     ) -> int:
         """Calculate a match score based on keyword presence and specificity."""
         score = 0
 
         # Check each pattern
         for pattern in patterns:
-            if re.search(pattern, text):
+            if pattern.search(text):
                 score += 10
 
-        # Additional scoring based on exact matches and specificity
-        for keyword in keywords:
+        # Additional scoring based on exact matches and specificity;
+        # patterns[i] is the word-boundary pattern for keywords[i]
+        padded_text = f" {text} "
+        for keyword, pattern in zip(keywords, patterns):
             # Exact match gets highest score
-            if f" {keyword} " in f" {text} ":
+            if f" {keyword} " in padded_text:
                 score += 15
             # Contains with word boundaries
-            elif re.search(r"\b" + re.escape(keyword) + r"\b", text):
+            elif pattern.search(text):
                 score += 10
             # Simple contains (lowest score)
             elif keyword in text:
@@ -103,25 +118,23 @@ class ProductCategorizer:
         # Also create a combined string for broader matching
         combined_text = " ".join(texts_to_search)
 
-        patterns = self.config.get("gender_age_patterns", {})
-
         # Track matches with scores
         gender_scores = {}
 
-        for category, pattern_list in patterns.items():
+        for category, pattern_list in self._gender_patterns.items():
             score = 0
 
             # Check each text individually
             for text in texts_to_search:
-                for pattern in pattern_list:
-                    if re.search(r"\b" + re.escape(pattern) + r"\b", text):
+                for pattern, regex in pattern_list:
+                    if regex.search(text):
                         score += 10
                     elif pattern in text:
                         score += 5
 
             # Check combined text
-            for pattern in pattern_list:
-                if re.search(r"\b" + re.escape(pattern) + r"\b", combined_text):
+            for pattern, regex in pattern_list:
+                if regex.search(combined_text):
                     score += 5
                 elif pattern in combined_text:
                     score += 2
@@ -203,7 +216,7 @@ class ProductCategorizer:
             # Check for excludes
             exclude_score = 0
             for exclude_pattern in patterns["exclude"]:
-                if re.search(exclude_pattern, normalized):
+                if exclude_pattern.search(normalized):
                     exclude_score += 20  # Heavy penalty for excluded terms
                     break
 
@@ -288,7 +301,7 @@ class ProductCategorizer:
             (tags_text, "tags"),
         ]
 
-        all_matches = {}
+        all_matches = defaultdict(int)
 
         for text, source_name in sources:
             if not text:
@@ -316,8 +329,6 @@ class ProductCategorizer:
 
                 if final_score > 0:
                     # Add to aggregate scores
-                    if category not in all_matches:
-                        all_matches[category] = 0
                     all_matches[category] += final_score
 
         if all_matches:
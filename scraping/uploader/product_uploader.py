@@ -4,17 +4,32 @@ Filters to only upload available products (in-stock with valid prices).
 """
 
 import json
+import random
 import re
 import html as html_lib
-from typing import List, Dict, Any, Optional, Tuple
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import List, Dict, Any, Collection, Iterable, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 import time
 
 from uploader.base_uploader import BaseUploader
 from uploader.data_processor import DataProcessor
+from psycopg.rows import tuple_row
+from core.file_manager import ensure_dir, load_json
 from core.logger import uploader_logger
 from uploader.product_categorizer import ProductCategorizer
+import config.settings as settings
+
+# Images and variants only depend on their product rows, so a file's image
+# upsert runs here while its variants upload on the calling thread
+_image_upload_pool = ThreadPoolExecutor(
+    max_workers=settings.UPLOADER_CONFIG["max_workers"],
+    thread_name_prefix="image_upload",
+)
 
 
 class HtmlSanitizer:
@@ -322,7 +337,7 @@ class ProductProcessor:
             # Apply filters
             skip, reason = self.should_skip_product(variants, min_price)
             if skip:
-                uploader_logger.debug(f"Skipping product {product_id}: {reason}")
+                uploader_logger.debug("Skipping product %s: %s", product_id, reason)
                 return None
 
             # Product passed filters - continue processing
@@ -429,6 +444,9 @@ class ProductProcessor:
             if not url and product.get("handle"):
                 url = f"https://{product.get('shop_domain', 'store')}.myshopify.com/products/{product['handle']}"
 
+            # One timestamp for the product and all of its variant/image rows
+            updated_at = product.get("updated_at") or datetime.now().isoformat()
+
             # Build product data with gender categories
             product_data = {
                 # Core product info
@@ -468,8 +486,7 @@ class ProductProcessor:
                 "updated_at": product.get("updated_at"),
                 "updated_at_external": product.get("updated_at"),
                 "published_at_external": product.get("published_at"),
-                "last_modified": product.get("updated_at")
-                or datetime.now().isoformat(),
+                "last_modified": updated_at,
             }
 
             self.collections["products"].append(product_data)
@@ -485,8 +502,7 @@ class ProductProcessor:
                     "price": variant_entry["price"],
                     "compare_at_price": variant_entry["compare_at_price"],
                     "size": variant_entry.get("size"),
-                    "updated_at": product.get("updated_at")
-                    or datetime.now().isoformat(),
+                    "updated_at": updated_at,
                 }
                 self.collections["variants"].append(variant_db_entry)
 
@@ -500,8 +516,7 @@ class ProductProcessor:
                     "position": img_entry["position"],
                     "width": img_entry["width"],
                     "height": img_entry["height"],
-                    "updated_at": product.get("updated_at")
-                    or datetime.now().isoformat(),
+                    "updated_at": updated_at,
                 }
                 self.collections["images"].append(image_db_entry)
 
@@ -630,6 +645,15 @@ class ProductUploader(BaseUploader):
             preserve_html=preserve_html,
         )
 
+        # Shop names looked up so far, shared by all files in a run
+        self._shop_names: Dict[str, str] = {}
+        self._shop_names_lock = threading.Lock()
+
+        # Per-thread processors for concurrent file uploads
+        self._thread_local = threading.local()
+        self._thread_processors: List[ProductProcessor] = []
+        self._thread_processors_lock = threading.Lock()
+
         uploader_logger.info(
             f"ProductUploader initialized: "
             f"filter_available_only={filter_available_only}, "
@@ -646,51 +670,49 @@ class ProductUploader(BaseUploader):
         return []
 
     def _get_shop_names_mapping(self, shop_ids: set) -> Dict[str, str]:
-        """Get shop names for a set of shop IDs."""
-        shop_id_to_name = {}
+        """Get shop names for a set of shop IDs.
 
+        Names already fetched during this run are reused; the rest are
+        looked up in a single query.
+        """
         if not shop_ids:
-            return shop_id_to_name
+            return {}
 
-        try:
-            shop_ids_list = list(shop_ids)
-
-            # Query shops table with smaller batches
-            all_shops = []
-            batch_size = 50
+        with self._shop_names_lock:
+            missing = [sid for sid in shop_ids if sid not in self._shop_names]
 
-            for i in range(0, len(shop_ids_list), batch_size):
-                batch = shop_ids_list[i : i + batch_size]
-                batch_num = i // batch_size + 1
-                total_batches = (len(shop_ids_list) - 1) // batch_size + 1
+        if missing:
+            try:
 
-                def get_shops_batch(conn):
+                def get_shops(conn):
                     with conn.cursor() as cur:
                         # Using ANY(%s) for array check
                         cur.execute(
                             'SELECT "id", "shop_name" FROM "shops" WHERE "id" = ANY(%s)',
-                            (batch,),
+                            (missing,),
                         )
                         return cur.fetchall()
 
-                shops_batch = self.db.safe_execute(
-                    get_shops_batch,
-                    f"Get shop names batch {batch_num}/{total_batches}",
+                shops = self.db.safe_execute(
+                    get_shops,
+                    f"Get shop names for {len(missing)} shops",
                     max_retries=2,
                 )
 
-                if shops_batch:
-                    all_shops.extend(shops_batch)
-
-            if all_shops:
-                for shop in all_shops:
-                    shop_id_to_name[str(shop["id"])] = shop["shop_name"]
+                if shops:
+                    with self._shop_names_lock:
+                        for shop in shops:
+                            self._shop_names[str(shop["id"])] = shop["shop_name"]
 
-            uploader_logger.debug(f"Found {len(shop_id_to_name)} shop names")
+            except Exception as e:
+                uploader_logger.error(f"Error fetching shop names: {e}")
 
-        except Exception as e:
-            uploader_logger.error(f"Error fetching shop names: {e}")
+        with self._shop_names_lock:
+            shop_id_to_name = {
+                sid: self._shop_names[sid] for sid in shop_ids if sid in self._shop_names
+            }
 
+        uploader_logger.debug("Found %d shop names", len(shop_id_to_name))
         return shop_id_to_name
 
     def _is_timeout_error(self, error: Exception) -> bool:
@@ -706,6 +728,19 @@ class ProductUploader(BaseUploader):
             ]
         )
 
+    def _timeout_backoff_delay(self, attempt: int) -> float:
+        """Jittered exponential backoff delay before retry `attempt + 1`.
+
+        Upload workers run in parallel, so the jitter keeps them from all
+        retrying against a struggling database at the same moment.
+        """
+        config = self.timeout_retry_config
+        delay = min(
+            config["initial_delay"] * (config["backoff_factor"] ** (attempt - 1)),
+            config["max_delay"],
+        )
+        return random.uniform(delay / 2, delay)
+
     def _handle_timeout_retry(
         self,
         operation_type: str,
@@ -725,11 +760,7 @@ class ProductUploader(BaseUploader):
             )
             return False
 
-        # Calculate exponential backoff delay
-        delay = min(
-            config["initial_delay"] * (config["backoff_factor"] ** (attempt - 1)),
-            config["max_delay"],
-        )
+        delay = self._timeout_backoff_delay(attempt)
 
         self.logger.warning(
             f"Timeout attempt {attempt}/{max_retries} for {operation_name}. "
@@ -834,10 +865,7 @@ class ProductUploader(BaseUploader):
                     )
                     if attempt < max_retries:
                         # Wait and retry with same data
-                        time.sleep(
-                            config["initial_delay"]
-                            * (config["backoff_factor"] ** (attempt - 1))
-                        )
+                        time.sleep(self._timeout_backoff_delay(attempt))
                     else:
                         self.logger.error(f"Max retries exceeded for {operation_name}")
                         return False
@@ -931,12 +959,7 @@ class ProductUploader(BaseUploader):
                     )
                     if attempt < max_retries:
                         # Exponential backoff
-                        delay = min(
-                            config["initial_delay"]
-                            * (config["backoff_factor"] ** (attempt - 1)),
-                            config["max_delay"],
-                        )
-                        time.sleep(delay)
+                        time.sleep(self._timeout_backoff_delay(attempt))
                     else:
                         self.logger.error(f"Max retries exceeded for {operation_name}")
                         return False
@@ -999,25 +1022,29 @@ class ProductUploader(BaseUploader):
 
         return None
 
-    def process_file(self, filepath: Path, shop_product_ids: Dict[str, set]) -> bool:
+    def process_file(
+        self,
+        filepath: Path,
+        shop_product_ids: Dict[str, set],
+        processor: Optional[ProductProcessor] = None,
+    ) -> bool:
         """Process a single product file with filtering and HTML support."""
+        processor = processor or self.product_processor
         self.logger.info(f"📦 Processing product file: {filepath.name}")
 
         try:
             # Load JSON data
-            with open(filepath, "r", encoding="utf-8") as f:
-                products = json.load(f)
+            products = load_json(filepath)
 
             self.logger.info(f"Found {len(products)} products in file")
 
             # Reset processor for this file
-            self.product_processor.reset_collections()
+            processor.reset_collections()
 
             # Collect all shop IDs first
-            all_shop_ids = set()
-            for product in products:
-                if shop_id := product.get("shop_id"):
-                    all_shop_ids.add(str(shop_id))
+            all_shop_ids = {
+                str(shop_id) for product in products if (shop_id := product.get("shop_id"))
+            }
 
             # Get shop names for all shops in this file
             shop_id_to_name = self._get_shop_names_mapping(all_shop_ids)
@@ -1027,7 +1054,7 @@ class ProductUploader(BaseUploader):
             # Process each product with filtering
             for idx, product in enumerate(products, 1):
                 if idx % 100 == 0:
-                    self.logger.debug(f"Processed {idx}/{len(products)} products")
+                    self.logger.debug("Processed %d/%d products", idx, len(products))
 
                 raw_shop_id = product.get("shop_id")
 
@@ -1053,14 +1080,14 @@ class ProductUploader(BaseUploader):
                     product["shop_name"] = None
 
                 # Process product with filters
-                product_id = self.product_processor.process_product(product)
+                product_id = processor.process_product(product)
                 if product_id:
                     if shop_id_str:
                         shop_product_ids[shop_id_str].add(str(product_id))
                     product_ids.append(product_id)
 
             # Log statistics
-            stats = self.product_processor.get_stats()
+            stats = processor.get_stats()
             filter_stats = stats["filter_stats"]
             desc_stats = stats["description_stats"]
             total = filter_stats["total_processed"]
@@ -1084,7 +1111,7 @@ class ProductUploader(BaseUploader):
             # Upload if we have products
             if uploaded > 0:
                 # Upload products
-                products_data = self.product_processor.collections["products"]
+                products_data = processor.collections["products"]
 
                 self.logger.info(f"🚀 Uploading {uploaded} products to database...")
 
@@ -1097,8 +1124,20 @@ class ProductUploader(BaseUploader):
                 if success:
                     self.logger.info(f"✅ Successfully uploaded {uploaded} products")
 
+                    # Start images in the background; they don't depend on variants
+                    images = processor.collections.get("images", [])
+                    images_future = None
+                    if images:
+                        self.logger.info(f"🖼️  Uploading {len(images)} images...")
+                        images_future = _image_upload_pool.submit(
+                            self._safe_bulk_upsert,
+                            data=images,
+                            table_name="images",
+                            on_conflict="id",
+                        )
+
                     # Upload variants
-                    variants = self.product_processor.collections.get("variants", [])
+                    variants = processor.collections.get("variants", [])
                     if variants:
                         self.logger.info(f"📋 Uploading {len(variants)} variants...")
                         variants_success = self._safe_bulk_upsert(
@@ -1109,13 +1148,13 @@ class ProductUploader(BaseUploader):
                         else:
                             self.logger.error("❌ Failed to upload variants")
 
-                    # Upload images
-                    images = self.product_processor.collections.get("images", [])
-                    if images:
-                        self.logger.info(f"🖼️  Uploading {len(images)} images...")
-                        images_success = self._safe_bulk_upsert(
-                            data=images, table_name="images", on_conflict="id"
-                        )
+                    # Wait for images
+                    if images_future is not None:
+                        try:
+                            images_success = images_future.result()
+                        except Exception as e:
+                            self.logger.error(f"Image upload raised: {e}")
+                            images_success = False
                         if images_success:
                             self.logger.info(f"✅ Uploaded {len(images)} images")
                         else:
@@ -1144,13 +1183,7 @@ class ProductUploader(BaseUploader):
                     self.logger.error(
                         f"❌ Failed to upload products from {filepath.name}"
                     )
-                    # Move file to failed directory
-                    try:
-                        failed_dir = self.file_manager.data_dirs["failed"] / "products"
-                        failed_dir.mkdir(parents=True, exist_ok=True)
-                        filepath.rename(failed_dir / filepath.name)
-                    except Exception as e:
-                        self.logger.error(f"Failed to move file to failed: {e}")
+                    # Left in raw so the next run retries it
                     return False
             else:
                 self.logger.warning(f"⚠️  No products passed filters in {filepath.name}")
@@ -1163,31 +1196,82 @@ class ProductUploader(BaseUploader):
 
         except json.JSONDecodeError as e:
             self.logger.error(f"❌ JSON decode error in {filepath.name}: {e}")
-            try:
-                failed_dir = self.file_manager.data_dirs["failed"] / "products"
-                failed_dir.mkdir(parents=True, exist_ok=True)
-                filepath.rename(failed_dir / filepath.name)
-            except Exception as e2:
-                self.logger.error(f"Failed to move file to failed: {e2}")
+            self._move_to_failed(filepath)
             return False
         except Exception as e:
             self.logger.error(f"❌ Error processing {filepath.name}: {e}")
             import traceback
 
             self.logger.error(traceback.format_exc())
-            try:
-                failed_dir = self.file_manager.data_dirs["failed"] / "products"
-                failed_dir.mkdir(parents=True, exist_ok=True)
-                filepath.rename(failed_dir / filepath.name)
-            except Exception as e2:
-                self.logger.error(f"Failed to move file to failed: {e2}")
             return False
 
+    def _move_to_failed(self, filepath: Path) -> None:
+        """Move an unreadable product file to failed/products.
+
+        Only for files that can never be uploaded; upload failures stay in
+        raw so they are retried.
+        """
+        try:
+            failed_dir = self.file_manager.data_dirs["failed"] / "products"
+            ensure_dir(failed_dir)
+            filepath.rename(failed_dir / filepath.name)
+        except Exception as e:
+            self.logger.error(f"Failed to move file to failed: {e}")
+
+    def _get_existing_product_ids_by_shop(
+        self, shop_ids: List[str], current_ids: Iterable[str] = ()
+    ) -> Optional[Dict[str, set]]:
+        """Fetch existing product IDs for several shops in one query.
+
+        IDs in current_ids are filtered out by the database, so only
+        candidates for stale cleanup come back over the wire.
+        """
+        if not shop_ids:
+            return {}
+        current_ids = [str(cid).strip() for cid in current_ids]
+        # shop_id is an integer column; non-numeric ids can't match anyway
+        numeric_shop_ids = [int(sid) for sid in map(str, shop_ids) if sid.isdigit()]
+
+        def get_existing_products(conn):
+            # Shops with no rows still get an (empty) entry
+            existing_by_shop = defaultdict(set, {str(sid): set() for sid in shop_ids})
+
+            # Plain tuples of text instead of a dict per row, consumed as
+            # they arrive rather than materialized with fetchall()
+            with conn.cursor(row_factory=tuple_row) as cur:
+                # Anti-join against the current IDs so the planner can hash
+                # them once instead of scanning the array for every row
+                cur.execute(
+                    'SELECT p."shop_id"::text, p."id"::text '
+                    'FROM "products_with_details_core" p '
+                    'WHERE p."shop_id" = ANY(%s::bigint[]) AND p."id" IS NOT NULL '
+                    'AND NOT EXISTS ('
+                    'SELECT 1 FROM unnest(%s::text[]) AS c(id) WHERE c.id = p."id"::text)',
+                    (numeric_shop_ids, current_ids),
+                )
+                for shop_id, product_id in cur:
+                    existing_by_shop[shop_id].add(product_id.strip())
+
+            return dict(existing_by_shop)
+
+        return self._safe_execute_query(
+            get_existing_products,
+            f"Get existing product IDs for {len(shop_ids)} shops",
+            max_retries=2,
+        )
+
     def cleanup_stale_records(
-        self, current_ids: List[str], shop_id: Optional[str] = None
+        self,
+        current_ids: Collection[str],
+        shop_id: Optional[str] = None,
+        existing_ids: Optional[set] = None,
     ) -> bool:
         """
         Remove products from database that are no longer in the current data.
+
+        If existing_ids is given, it is used instead of querying the
+        database for the shop's current product IDs. It only needs to
+        contain the IDs that are not in current_ids.
         """
         try:
             if not current_ids:
@@ -1195,35 +1279,36 @@ class ProductUploader(BaseUploader):
 
             self.logger.debug(f"Starting cleanup for shop {shop_id}...")
 
-            # Get all product IDs for this shop from database
-            def get_existing_products(conn):
-                with conn.cursor() as cur:
-                    sql = 'SELECT "id" FROM "products_with_details_core"'
-                    params = []
-                    if shop_id:
-                        sql += ' WHERE "shop_id" = %s'
-                        params.append(shop_id)
-                    cur.execute(sql, params)
-                    return cur.fetchall()
-
-            result = self._safe_execute_query(
-                get_existing_products,
-                f"Get existing product IDs for shop {shop_id}",
-                max_retries=2,
-            )
+            if existing_ids is None:
+                # Get all product IDs for this shop from database
+                def get_existing_products(conn):
+                    with conn.cursor() as cur:
+                        sql = 'SELECT "id" FROM "products_with_details_core"'
+                        params = []
+                        if shop_id:
+                            sql += ' WHERE "shop_id" = %s'
+                            params.append(shop_id)
+                        cur.execute(sql, params)
+                        return cur.fetchall()
 
-            if result is None:
-                self.logger.warning(
-                    f"Could not fetch existing products for shop {shop_id}"
+                result = self._safe_execute_query(
+                    get_existing_products,
+                    f"Get existing product IDs for shop {shop_id}",
+                    max_retries=2,
                 )
-                return True
 
-            # Normalize IDs
-            existing_ids = {
-                str(item.get("id")).strip()
-                for item in result
-                if item.get("id") is not None
-            }
+                if result is None:
+                    self.logger.warning(
+                        f"Could not fetch existing products for shop {shop_id}"
+                    )
+                    return True
+
+                # Normalize IDs
+                existing_ids = {
+                    str(item.get("id")).strip()
+                    for item in result
+                    if item.get("id") is not None
+                }
             current_ids_str = {str(cid).strip() for cid in current_ids}
             to_delete = list(existing_ids - current_ids_str)
 
@@ -1265,10 +1350,82 @@ class ProductUploader(BaseUploader):
             self.logger.error(f"Error in cleanup_stale_records: {e}")
             return False
 
+    def _get_thread_processor(self) -> ProductProcessor:
+        """Return the ProductProcessor owned by the current worker thread."""
+        processor = getattr(self._thread_local, "processor", None)
+        if processor is None:
+            processor = ProductProcessor(
+                filter_available_only=self.filter_available_only,
+                min_price_threshold=self.min_price_threshold,
+                preserve_html=self.preserve_html,
+            )
+            self._thread_local.processor = processor
+            with self._thread_processors_lock:
+                self._thread_processors.append(processor)
+        return processor
+
+    def _process_file_task(
+        self, filepath: Path, file_idx: int
+    ) -> Tuple[bool, Dict[str, Any], set, Dict[str, set]]:
+        """Process one file on a worker thread and return its results."""
+        self.logger.info(f"Processing file {file_idx}: {filepath.name}")
+
+        processor = self._get_thread_processor()
+        file_product_ids = defaultdict(set)
+        success = self.process_file(filepath, file_product_ids, processor)
+
+        shop_ids = {
+            shop_id
+            for product in processor.collections.get("products", [])
+            if (shop_id := product.get("shop_id"))
+        }
+        stats = processor.get_stats()
+
+        # Drop this file's rows so an idle worker doesn't keep them alive
+        processor.reset_collections()
+        return success, stats, shop_ids, file_product_ids
+
+    def _merge_file_results(
+        self,
+        file_results,
+        results: Dict[str, Any],
+        shop_product_ids: Dict[str, set],
+    ) -> None:
+        """Fold per-file results from _process_file_task into the run totals."""
+        for success, file_stats, file_shop_ids, file_product_ids in file_results:
+            if success:
+                results["processed_files"] += 1
+
+                # Accumulate stats
+                stats = file_stats["filter_stats"]
+                desc_stats = file_stats["description_stats"]
+
+                results["total_products_processed"] += stats["total_processed"]
+                results["total_products_uploaded"] += stats["uploaded"]
+                results["filter_stats"]["total_processed"] += stats["total_processed"]
+                results["filter_stats"]["uploaded"] += stats["uploaded"]
+                results["filter_stats"]["skipped"] += (
+                    stats["total_processed"] - stats["uploaded"]
+                )
+                results["description_stats"]["html_descriptions"] += desc_stats[
+                    "html_descriptions"
+                ]
+                results["description_stats"]["plain_text_descriptions"] += desc_stats[
+                    "plain_text_descriptions"
+                ]
+                results["description_stats"]["total_with_descriptions"] += stats[
+                    "descriptions_uploaded"
+                ]
+
+                results["shop_ids"].update(file_shop_ids)
+            else:
+                results["failed_files"] += 1
+
+            for shop_id, ids in file_product_ids.items():
+                shop_product_ids[shop_id].update(ids)
+
     def process_all(self) -> Dict[str, Any]:
         """Process all product files with comprehensive reporting."""
-        from collections import defaultdict
-
         files = self.find_data_files()
         results = {
             "processed_files": 0,
@@ -1303,59 +1460,69 @@ class ProductUploader(BaseUploader):
         # Track product IDs per shop across all files for deferred cleanup
         shop_product_ids = defaultdict(set)
 
-        for file_idx, filepath in enumerate(files, 1):
-            self.logger.info(f"\n{'='*60}")
-            self.logger.info(
-                f"Processing file {file_idx}/{len(files)}: {filepath.name}"
-            )
-            self.logger.info(f"{'='*60}")
-
-            # Pass the tracker to process_file
-            success = self.process_file(filepath, shop_product_ids)
-            if success:
-                results["processed_files"] += 1
+        # Files are named <shop_id>_products_<timestamp>.json; look up all
+        # of their shop names in one query up front instead of one per file
+        file_shop_ids = {f.name.split("_products_", 1)[0] for f in files}
+        self._get_shop_names_mapping({sid for sid in file_shop_ids if sid.isdigit()})
 
-                # Accumulate stats
-                stats = self.product_processor.get_stats()["filter_stats"]
-                desc_stats = self.product_processor.get_stats()["description_stats"]
+        # Files are independent, so upload several at once. The pool size
+        # also caps how many DB connections the uploads hold at a time.
+        max_workers = max(1, min(settings.UPLOADER_CONFIG["max_workers"], len(files)))
 
-                results["total_products_processed"] += stats["total_processed"]
-                results["total_products_uploaded"] += stats["uploaded"]
-                results["filter_stats"]["total_processed"] += stats["total_processed"]
-                results["filter_stats"]["uploaded"] += stats["uploaded"]
-                results["filter_stats"]["skipped"] += (
-                    stats["total_processed"] - stats["uploaded"]
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="product_upload"
+            ) as executor:
+                file_results = executor.map(
+                    self._process_file_task, files, range(1, len(files) + 1)
                 )
-                results["description_stats"]["html_descriptions"] += desc_stats[
-                    "html_descriptions"
-                ]
-                results["description_stats"]["plain_text_descriptions"] += desc_stats[
-                    "plain_text_descriptions"
-                ]
-                results["description_stats"]["total_with_descriptions"] += stats[
-                    "descriptions_uploaded"
-                ]
 
-                # Collect shop IDs
-                for product in self.product_processor.collections.get("products", []):
-                    if shop_id := product.get("shop_id"):
-                        results["shop_ids"].add(shop_id)
-            else:
-                results["failed_files"] += 1
+                try:
+                    self._merge_file_results(file_results, results, shop_product_ids)
+                except BaseException:
+                    # Interrupted: drop queued files instead of uploading them
+                    # all before the executor lets us exit
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+        finally:
+            # This run's worker threads are gone; don't keep their processors
+            with self._thread_processors_lock:
+                self._thread_processors.clear()
 
         # Perform deferred cleanup for each shop
         if shop_product_ids:
             self.logger.info(f"\n{'='*60}")
             self.logger.info(
-                "🧹 Performing deferred cleanup for {len(shop_product_ids)} shops"
+                f"🧹 Performing deferred cleanup for {len(shop_product_ids)} shops"
             )
             self.logger.info(f"{'='*60}")
 
-            for shop_id, current_ids in shop_product_ids.items():
-                self.logger.info(
-                    f"Cleaning up shop {shop_id} (tracking {len(current_ids)} active products)..."
+            # One query for every shop's stale candidates; falls back to
+            # per-shop queries if it fails
+            existing_by_shop = self._get_existing_product_ids_by_shop(
+                list(shop_product_ids.keys()),
+                chain.from_iterable(shop_product_ids.values()),
+            )
+            if existing_by_shop is None:
+                self.logger.warning(
+                    "Could not prefetch existing products, querying per shop"
+                )
+                existing_by_shop = {}
+
+            # Shops don't share rows, so clean several up at once. The pool
+            # size bounds concurrent delete traffic against the database.
+            with ThreadPoolExecutor(
+                max_workers=settings.UPLOADER_CONFIG["max_workers"],
+                thread_name_prefix="stale_cleanup",
+            ) as executor:
+                list(
+                    executor.map(
+                        self._cleanup_shop,
+                        shop_product_ids.keys(),
+                        shop_product_ids.values(),
+                        map(existing_by_shop.get, shop_product_ids.keys()),
+                    )
                 )
-                self.cleanup_stale_records(list(current_ids), shop_id)
 
         results["shop_ids"] = list(results["shop_ids"])
 
@@ -1364,6 +1531,18 @@ class ProductUploader(BaseUploader):
 
         return results
 
+    def _cleanup_shop(
+        self,
+        shop_id: str,
+        current_ids: Collection[str],
+        existing_ids: Optional[set] = None,
+    ) -> bool:
+        """Run deferred stale-record cleanup for one shop."""
+        self.logger.info(
+            f"Cleaning up shop {shop_id} (tracking {len(current_ids)} active products)..."
+        )
+        return self.cleanup_stale_records(current_ids, shop_id, existing_ids)
+
     def _display_final_statistics(self, results: Dict[str, Any]) -> None:
         """Display comprehensive final statistics."""
         total_processed = results["filter_stats"]["total_processed"]
@@ -1434,6 +1613,9 @@ class ProductUploader(BaseUploader):
     def reload_categorization_config(self):
         """Reload the categorization configuration."""
         self.product_processor.reload_categorization_config()
+        with self._thread_processors_lock:
+            for processor in self._thread_processors:
+                processor.reload_categorization_config()
         self.logger.info("🔄 Product categorization configuration reloaded")
 
 
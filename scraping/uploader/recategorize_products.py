@@ -59,6 +59,35 @@ def debug_product(product_id: int):
     print(f"  -> gender_age          : {category_info['gender_age']}")
 
 
+def update_categories(db: DatabaseClient, batch: list, description: str):
+    """Write a batch of (grouped_type, top_level, gender_age, id) rows.
+
+    The batch is sent as four arrays and applied by a single UPDATE joined
+    against unnest(), rather than one UPDATE statement per product.
+    """
+    grouped_types, top_levels, genders, ids = (list(col) for col in zip(*batch))
+
+    def do_update(conn):
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE products_with_details_core AS p
+                SET
+                    grouped_product_type = v.grouped_product_type,
+                    top_level_category = v.top_level_category,
+                    gender_age = v.gender_age,
+                    updated_at = NOW()
+                FROM unnest(%s::text[], %s::text[], %s::text[], %s::bigint[])
+                    AS v(grouped_product_type, top_level_category, gender_age, id)
+                WHERE p.id = v.id
+            """,
+                (grouped_types, top_levels, genders, ids),
+            )
+        conn.commit()
+
+    return db.safe_execute(do_update, description)
+
+
 def recategorize_all_products():
     """Re-categorize ALL products in database using updated config."""
 
@@ -89,7 +118,7 @@ def recategorize_all_products():
 
     updated = 0
     batch = []
-    batch_size = 100
+    batch_size = 1000
 
     for row in all_products:
         product_id = row["id"]
@@ -120,48 +149,14 @@ def recategorize_all_products():
 
         # Batch update
         if len(batch) >= batch_size:
-
-            def update_batch(conn, b=batch):
-                with conn.cursor() as cur:
-                    cur.executemany(
-                        """
-                        UPDATE products_with_details_core
-                        SET
-                            grouped_product_type = %s,
-                            top_level_category = %s,
-                            gender_age = %s,
-                            updated_at = NOW()
-                        WHERE id = %s
-                    """,
-                        b,
-                    )
-                conn.commit()
-
-            db.safe_execute(update_batch, f"Update batch of {len(batch)} products")
+            update_categories(db, batch, f"Update batch of {len(batch)} products")
             print(f"  Progress: {updated} / {len(all_products)} updated...")
             batch = []
 
     # Final batch
     if batch:
-
-        def update_final_batch(conn, b=batch):
-            with conn.cursor() as cur:
-                cur.executemany(
-                    """
-                    UPDATE products_with_details_core
-                    SET
-                        grouped_product_type = %s,
-                        top_level_category = %s,
-                        gender_age = %s,
-                        updated_at = NOW()
-                    WHERE id = %s
-                """,
-                    b,
-                )
-            conn.commit()
-
-        db.safe_execute(
-            update_final_batch, f"Update final batch of {len(batch)} products"
+        update_categories(
+            db, batch, f"Update final batch of {len(batch)} products"
         )
 
     print(f"\n✅ Re-categorization complete!")
@@ -7,6 +7,7 @@ from typing import List, Dict, Any
 
 from uploader.base_uploader import BaseUploader
 import config.settings as settings
+from config.product_type_loader import load_json_cached
 
 class ShopUploader(BaseUploader):
     """Uploader for shop data."""
@@ -90,8 +91,7 @@ class ShopUploader(BaseUploader):
             return results
 
         try:
-            with open(shop_file, 'r', encoding='utf-8') as f:
-                shop_list = json.load(f)
+            shop_list = load_json_cached(shop_file)
 
             if not isinstance(shop_list, list) or not shop_list:
                 self.logger.warning(f"No shops found in {shop_file}")